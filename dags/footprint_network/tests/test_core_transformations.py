@@ -56,6 +56,9 @@ def test_dimension_tables():
         logger.info(f"Transformed record types dimension: {len(record_types)} rows")
         logger.info(f"Record types by category:\n{record_types['category'].value_counts()}")
     
+    # Release the transformer's DuckDB connection
+    transformer.close()
+    
     return {
         'countries': countries,
         'years': years,
@@ -83,6 +86,9 @@ def test_fact_table():
                                'fishing_ground', 'builtup_land', 'carbon', 'value']].isnull().sum()
         logger.info(f"Missing values after cleaning:\n{null_counts}")
     
+    # Release the transformer's DuckDB connection
+    transformer.close()
+    
     return measures
 
 def test_ecological_indicators():
@@ -170,6 +176,9 @@ def test_ecological_indicators():
         except Exception as e:
             logger.warning(f"Could not create carbon dependency plot: {str(e)}")
     
+    # Release the transformer's DuckDB connection
+    transformer.close()
+    
     return {
         'ecological_balance': ecological_balance,
         'footprint_composition': footprint_composition
@@ -199,6 +208,9 @@ def test_time_series():
                     for _, row in top_changes.iterrows():
                         logger.info(f"  Country Code: {row['country_code']}, Record: {row['record']}, Value: {row['value']:.2f}")
     
+    # Release the transformer's DuckDB connection
+    transformer.close()
+    
     return time_series
 
 def test_geographical_aggregations():
@@ -230,6 +242,9 @@ def test_geographical_aggregations():
                             for _, row in recent_biocap.iterrows():
                                 logger.info(f"  {row['region']}: {row['value_mean']:.2f} gha/person (n={row['value_count']:.0f})")
     
+    # Release the transformer's DuckDB connection
+    transformer.close()
+    
     return geo_aggs
 
 def test_all_transformations():
@@ -251,6 +266,9 @@ def test_all_transformations():
         if not df.empty:
             logger.info(f"  {name}: {len(df)} rows, {len(df.columns)} columns")
     
+    # Release the transformer's DuckDB connection
+    transformer.close()
+    
     return all_results
 
 if __name__ == "__main__":
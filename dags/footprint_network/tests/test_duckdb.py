@@ -6,6 +6,7 @@ import sys
 import json
 import logging
 from datetime import datetime
+import pandas as pd
 
 # Add the parent directory to the path to import the utils
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -92,6 +93,43 @@ def run_test_queries(db):
     for row in result:
         logger.info(f"  {row[0]}, {row[1]}, {row[2]} ({row[3]})")
 
+def test_bulk_insert_and_upsert():
+    """
+    Test that bulk_insert adds rows and bulk_upsert updates the rows whose key exists.
+    """
+    db = FootprintDuckDBManager(':memory:')
+    try:
+        db.create_tables()
+        
+        countries = pd.DataFrame({
+            'country_code': [1, 2],
+            'country_name': ["United States", "Afghanistan"],
+            'iso_a2': ["US", "AF"]
+        })
+        assert db.bulk_insert(countries, 'countries') == 2
+        
+        # One existing key is updated and one new key is inserted
+        changes = pd.DataFrame({
+            'country_code': [2, 3],
+            'country_name': ["Islamic Republic of Afghanistan", "Albania"],
+            'iso_a2': ["AF", "AL"]
+        })
+        assert db.bulk_upsert(changes, 'countries', ['country_code']) == 2
+        
+        result = db.execute_query("SELECT country_code, country_name FROM countries ORDER BY country_code").fetchall()
+        assert result == [(1, "United States"), (2, "Islamic Republic of Afghanistan"), (3, "Albania")], result
+        
+        # Names that are not plain identifiers are rejected before any SQL is built
+        try:
+            db.bulk_insert(countries, 'countries; DROP TABLE years')
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("bulk_insert accepted an invalid table name")
+        logger.info("Bulk insert and upsert test passed")
+    finally:
+        db.close()
+
 if __name__ == "__main__":
     logger.info("Starting DuckDB test")
     
@@ -102,6 +140,9 @@ if __name__ == "__main__":
         # Run test queries
         run_test_queries(db)
         
+        # Check the vectorized insert and upsert
+        test_bulk_insert_and_upsert()
+        
         # Close the connection
         db.close()
         logger.info("DuckDB test completed successfully")
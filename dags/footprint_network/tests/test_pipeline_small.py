@@ -5,80 +5,285 @@ Quick test of the footprint network pipeline with limited data
 
 import os
 import sys
+import json
+import tempfile
+import hashlib
+import argparse
+import importlib
+import logging
+import logging.handlers
+import time
+import threading
+import traceback
+import tracemalloc
+import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+
+logger = logging.getLogger('test_pipeline')
 
 # Mock the airflow context for running outside of Airflow
 class MockTaskInstance:
+    def __init__(self):
+        # Values pushed by earlier steps, so later steps pull them instead of recomputing
+        self._xcom = {}
+    
     def xcom_push(self, key, value):
-        print(f"XCOM Push: {key} = {value}")
+        # Only build the message when it is logged; values can be large
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"XCOM Push: {key} ({sys.getsizeof(value)} bytes)")
+        self._xcom[key] = value
     
-    def xcom_pull(self, key):
-        print(f"XCOM Pull: {key}")
-        return None
+    def xcom_pull(self, key=None, task_ids=None, **kwargs):
+        logger.debug(f"XCOM Pull: {key}")
+        return self._xcom.get(key)
 
-# Add current directory and dags to Python path
 current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
-sys.path.insert(0, str(current_dir / 'dags'))
 
-# Import DAG functions
-from footprint_network_pipeline_dag import extract_data, transform_data, load_data
+# Only test 3 countries and 2 record types, split once here rather than in every step
+COUNTRIES = tuple(c.strip() for c in 'USA,CAN,MEX'.split(','))
+RECORD_TYPES = tuple(r.strip() for r in 'BiocapTotGHA,EcofootTotGHA'.split(','))
+
+# Directory for the files this test keeps between runs, outside the source tree
+OUTPUT_DIR = Path(tempfile.gettempdir()) / 'footprint_network_test_pipeline_small'
+
+# Directory holding the cached extract results between runs of this test
+CACHE_DIR = OUTPUT_DIR / 'cache'
+
+# Per-step timings appended by every run, for spotting regressions across runs
+PERF_FILE = OUTPUT_DIR / 'perf.jsonl'
+
+# Trace of the last run's steps in Chrome trace event format, for chrome://tracing or Perfetto
+TRACE_FILE = OUTPUT_DIR / 'trace.json'
+
+def load_pipeline():
+    """
+    Import the DAG module on first use, so importing this file has no Airflow side effects.
+    """
+    # Add the dags directory (two levels up from tests) to Python path
+    dags_dir = str(current_dir.parent.parent)
+    if dags_dir not in sys.path:
+        sys.path.insert(0, dags_dir)
+    return importlib.import_module('footprint_network_pipeline_dag')
+
+def cached_extract(pipeline, context, use_cache=True):
+    """
+    Run extract_data, reusing the files of an earlier run with the same parameters.
+    
+    The cache entry records the extraction timestamp and raw files pushed to XCom,
+    keyed by the countries, years and record types. It is used only while all of
+    those raw files still exist.
+    """
+    params = context['params']
+    key_params = {name: params[name] for name in ('start_year', 'end_year', 'countries', 'record_types')}
+    key = hashlib.sha256(json.dumps(key_params, sort_keys=True).encode()).hexdigest()[:16]
+    cache_file = CACHE_DIR / f"extract_{key}.json"
+    raw_dir = pipeline.get_base_paths()['raw_dir']
+    
+    if use_cache and cache_file.exists():
+        cached = json.loads(cache_file.read_text())
+        if all(os.path.exists(os.path.join(raw_dir, f)) for f in cached['raw_files']):
+            print(f"♻️  Reusing extraction {cached['extraction_timestamp']} from {cache_file}")
+            context['ti'].xcom_push('extraction_timestamp', cached['extraction_timestamp'])
+            context['ti'].xcom_push('raw_files', cached['raw_files'])
+            return cached['extraction_timestamp']
+    
+    extraction_timestamp = pipeline.extract_data(**context)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps({
+        'extraction_timestamp': extraction_timestamp,
+        'raw_files': context['ti'].xcom_pull(key='raw_files') or []
+    }))
+    return extraction_timestamp
+
+def missing_triples(pipeline, params):
+    """
+    Return the requested (country, year, record type) triples not yet in the database.
+    
+    Everything is missing when DuckDB is unavailable or nothing has been loaded yet.
+    """
+    wanted = {
+        (country, year, record)
+        for country in params['countries']
+        for year in range(params['start_year'], params['end_year'] + 1)
+        for record in params['record_types']
+    }
+    db_path = pipeline.get_base_paths()['db_path']
+    if not pipeline.DUCKDB_AVAILABLE or not os.path.exists(db_path):
+        return wanted
+    
+    # Share the process-wide connection the load step will use for the same file
+    duckdb_importer = importlib.import_module('footprint_network.utils.duckdb_importer')
+    try:
+        rows = duckdb_importer.get_connection(db_path).execute("""
+            SELECT DISTINCT CAST(country_code AS VARCHAR), CAST(year AS INTEGER), CAST(record AS VARCHAR)
+            FROM ecological_measures
+            WHERE year BETWEEN ? AND ?
+        """, [params['start_year'], params['end_year']]).fetchall()
+    except Exception as e:
+        logger.debug(f"Could not read loaded triples: {str(e)}")
+        return wanted
+    return wanted - set(rows)
+
+def year_chunks(start_year, end_year, size):
+    """
+    Split an inclusive year range into consecutive (start, end) chunks of at most size years.
+    """
+    return [(year, min(year + size - 1, end_year)) for year in range(start_year, end_year + 1, size)]
+
+def chunked_extract(pipeline, context, year_chunk, use_cache=True):
+    """
+    Extract the year range one chunk of year_chunk years at a time.
+    
+    Only one chunk's responses are in memory at once. Each chunk is cached on its own,
+    and the raw files of all chunks are pushed to XCom together for the later steps.
+    """
+    params = context['params']
+    raw_files = []
+    for start_year, end_year in year_chunks(params['start_year'], params['end_year'], year_chunk):
+        print(f"   Years {start_year}-{end_year}")
+        chunk_params = MappingProxyType({**params, 'start_year': start_year, 'end_year': end_year})
+        chunk_context = {**context, 'params': chunk_params, 'dag_run': SimpleNamespace(conf=chunk_params)}
+        extraction_timestamp = cached_extract(pipeline, chunk_context, use_cache=use_cache)
+        raw_files.extend(context['ti'].xcom_pull(key='raw_files') or [])
+    # Chunks extracted within the same second share their dataset partitions
+    context['ti'].xcom_push('raw_files', list(dict.fromkeys(raw_files)))
+    return extraction_timestamp
+
+def trace_event(name, phase):
+    """
+    Build a Chrome trace event marking the beginning ('B') or end ('E') of a step.
+    """
+    return {
+        'name': name,
+        'ph': phase,
+        'ts': int(time.perf_counter() * 1e6),
+        'pid': os.getpid(),
+        'tid': threading.get_ident()
+    }
+
+def run_step(name, step, stats, events):
+    """
+    Run one pipeline step, recording its wall time and traced memory growth in stats
+    and its begin and end trace events in events.
+    """
+    events.append(trace_event(name, 'B'))
+    start_time = time.perf_counter()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    status = 'ok'
+    try:
+        return step()
+    except Exception as e:
+        status = f'error: {str(e)}'
+        raise
+    finally:
+        events.append(trace_event(name, 'E'))
+        stats.append({
+            'step': name,
+            'seconds': time.perf_counter() - start_time,
+            'memory_bytes': tracemalloc.get_traced_memory()[0] - start_memory,
+            'status': status
+        })
+
+def report_stats(stats, events):
+    """
+    Print the per-step timings, append them to PERF_FILE and write the trace to TRACE_FILE.
+    """
+    print("\n⏱️  Step timings")
+    for entry in stats:
+        print(f"{entry['step']:12s} {entry['seconds']:8.2f}s  Δmem={entry['memory_bytes'] / 1e6:6.1f}MB  {entry['status']}")
+    with open(PERF_FILE, 'a') as f:
+        f.write(json.dumps({'timestamp': time.time(), 'steps': stats}) + '\n')
+    with open(TRACE_FILE, 'w') as f:
+        json.dump({'traceEvents': events}, f)
 
 def main():
     """
     Test the DAG functions with limited scope
     """
+    parser = argparse.ArgumentParser(description="Quick test of the pipeline with limited data")
+    parser.add_argument("--no-cache", action="store_true", help="Clear cached extract results and call the API")
+    parser.add_argument("--year-chunk", type=int, default=5, help="Number of years extracted per chunk")
+    args = parser.parse_args()
     
-    # Mock Airflow context with limited parameters for quick testing
+    # Send pipeline logs to a rotating file so console output stays limited to the step results
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO'),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.handlers.RotatingFileHandler(
+            OUTPUT_DIR / 'test_pipeline_small.log', maxBytes=2 << 20, backupCount=3
+        )]
+    )
+    
+    pipeline = load_pipeline()
+    if args.no_cache:
+        for cache_file in CACHE_DIR.glob('extract_*.json'):
+            cache_file.unlink()
+    
+    # Limited parameters for quick testing, built once and shared read-only by conf and params
+    params = MappingProxyType({
+        'start_year': 2020,  # Only test 3 recent years
+        'end_year': 2022,
+        'countries': COUNTRIES,
+        'record_types': RECORD_TYPES,
+        'mode': 'full',
+        'api_username': os.getenv('FOOTPRINT_NETWORK_USERNAME'),
+        'api_key': os.getenv('FOOTPRINT_NETWORK_API_KEY')
+    })
+    
+    # Skip the run when every requested triple is already loaded; otherwise extract only the countries missing some
+    missing = missing_triples(pipeline, params)
+    if not missing:
+        print("✅ Data already loaded, skipping the pipeline")
+        return
+    missing_countries = {country for country, _, _ in missing}
+    params = MappingProxyType({**params, 'countries': tuple(c for c in params['countries'] if c in missing_countries)})
+    
+    # Keep-alive session shared by all of extract_data's country workers
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount('https://', adapter)
+    
+    # Mock Airflow context
     context = {
         'ti': MockTaskInstance(),
-        'dag_run': type('MockDagRun', (), {
-            'conf': {
-                'start_year': 2020,  # Only test 3 recent years
-                'end_year': 2022,
-                'countries': 'USA,CAN,MEX',  # Only test 3 countries
-                'record_types': 'BiocapTotGHA,EcofootTotGHA',  # Only 2 record types
-                'mode': 'full',
-                'api_username': os.getenv('FOOTPRINT_NETWORK_USERNAME'),
-                'api_key': os.getenv('FOOTPRINT_NETWORK_API_KEY')
-            }
-        })(),
-        'params': {
-            'start_year': 2020,
-            'end_year': 2022,
-            'countries': 'USA,CAN,MEX',
-            'record_types': 'BiocapTotGHA,EcofootTotGHA',
-            'mode': 'full',
-            'api_username': os.getenv('FOOTPRINT_NETWORK_USERNAME'),
-            'api_key': os.getenv('FOOTPRINT_NETWORK_API_KEY')
-        }
+        'dag_run': SimpleNamespace(conf=params),
+        'params': params,
+        'session': session
     }
     
     print("🧪 Testing Footprint Network Pipeline with LIMITED data (3 countries, 3 years)")
     print("=" * 70)
     
+    # Each step runs and is timed on its own, so a failure or slowdown is attributed to it
+    steps = [
+        ('extract', "Step 1: Extract Data (Limited scope)", "Extraction",
+         lambda: chunked_extract(pipeline, context, args.year_chunk, use_cache=not args.no_cache)),
+        ('transform', "\nStep 2: Transform Data", "Transformation", lambda: pipeline.transform_data(**context)),
+        ('load', "\nStep 3: Load Data", "Load", lambda: pipeline.load_data(**context)),
+    ]
+    stats = []
+    events = []
+    tracemalloc.start()
     try:
-        print("Step 1: Extract Data (Limited scope)")
-        extraction_result = extract_data(**context)
-        print(f"✅ Extraction completed successfully!")
-        print(f"📊 Result summary: {type(extraction_result)}")
-        
-        print("\nStep 2: Transform Data")
-        transformation_result = transform_data(**context)
-        print(f"✅ Transformation completed successfully!")
-        
-        print("\nStep 3: Load Data")
-        load_result = load_data(**context)
-        print(f"✅ Load completed successfully!")
-        
-        print("\n🎉 PIPELINE TEST SUCCESSFUL!")
-        print("=" * 70)
-        print("The pipeline works! You can now run with full parameters if needed.")
-        
-    except Exception as e:
-        print(f"❌ Error during pipeline execution: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        for name, title, label, step in steps:
+            print(title)
+            try:
+                run_step(name, step, stats, events)
+            except Exception as e:
+                print(f"❌ Error during {name}: {str(e)}")
+                traceback.print_exc()
+                break
+            print(f"✅ {label} completed successfully!")
+        else:
+            print("\n🎉 PIPELINE TEST SUCCESSFUL!")
+            print("=" * 70)
+            print("The pipeline works! You can now run with full parameters if needed.")
+    finally:
+        tracemalloc.stop()
+        report_stats(stats, events)
 
 if __name__ == "__main__":
     main()
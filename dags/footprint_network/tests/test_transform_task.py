@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+End-to-end test of the pipeline's transform_data task on synthetic raw data
+"""
+
+import os
+import sys
+import json
+import random
+import shutil
+import logging
+import tempfile
+import importlib
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+logger = logging.getLogger('test_transform_task')
+
+current_dir = Path(__file__).parent
+
+# Country codes, years and record types of the synthetic raw data
+COUNTRIES = ('39', '43', '142', '35', '113', '66')
+YEARS = range(2015, 2021)
+RECORD_TYPES = ('BiocapPerCap', 'EFConsPerCap', 'Population', 'GDP')
+
+class MockTaskInstance:
+    def __init__(self):
+        self._xcom = {}
+
+    def xcom_push(self, key, value):
+        self._xcom[key] = value
+
+    def xcom_pull(self, key=None, task_ids=None, **kwargs):
+        return self._xcom.get(key)
+
+def load_pipeline():
+    """
+    Import the DAG module, adding the dags directory to the path.
+    """
+    dags_dir = str(current_dir.parent.parent)
+    if dags_dir not in sys.path:
+        sys.path.insert(0, dags_dir)
+    return importlib.import_module('footprint_network_pipeline_dag')
+
+def write_raw_data(raw_dir):
+    """
+    Write synthetic API responses laid out the way extract_data stores them.
+    """
+    for sub in ('countries', 'years', 'types', 'data'):
+        os.makedirs(os.path.join(raw_dir, sub), exist_ok=True)
+
+    countries = [
+        {'countryCode': code, 'countryName': f'C{code}', 'shortName': f'S{code}', 'isoa2': 'XX', 'score': 'A'}
+        for code in COUNTRIES
+    ]
+    types = [{'code': record, 'name': record, 'note': '', 'record': record} for record in RECORD_TYPES]
+    with open(os.path.join(raw_dir, 'countries', 'countries_20240101_000000.json'), 'w') as f:
+        json.dump(countries, f)
+    with open(os.path.join(raw_dir, 'years', 'years_20240101_000000.json'), 'w') as f:
+        json.dump([{'year': year} for year in YEARS], f)
+    with open(os.path.join(raw_dir, 'types', 'types_20240101_000000.json'), 'w') as f:
+        json.dump(types, f)
+
+    rng = random.Random(0)
+    for code in COUNTRIES:
+        for year in YEARS:
+            records = [{
+                'id': None, 'version': None, 'countryCode': int(code), 'countryName': f'C{code}',
+                'shortName': f'S{code}', 'isoa2': 'XX', 'year': year, 'record': record,
+                'cropLand': rng.random(), 'grazingLand': rng.random(), 'forestLand': None,
+                'fishingGround': rng.random(), 'builtupLand': rng.random(), 'carbon': rng.random(),
+                'value': rng.random() * 10 + 0.1, 'score': '3A'
+            } for record in RECORD_TYPES]
+            with open(os.path.join(raw_dir, 'data', f'country_{code}_{year}_20240101_000000.json'), 'w') as f:
+                json.dump(records, f)
+
+def test_transform_data_end_to_end():
+    """
+    Run transform_data with the core transformer writing into the task's own transformed
+    directory, and check every table is saved as a single Parquet file with its rows.
+    """
+    pytest.importorskip('airflow')
+
+    pipeline = load_pipeline()
+    root = tempfile.mkdtemp()
+    paths = {name: os.path.join(root, name.replace('_dir', '')) for name in ('raw_dir', 'processed_dir', 'transformed_dir')}
+    for directory in paths.values():
+        os.makedirs(directory, exist_ok=True)
+    paths.update(base_dir=root, data_dir=root, db_path=os.path.join(root, 'footprint_network.duckdb'))
+    write_raw_data(paths['raw_dir'])
+
+    def make_transformer():
+        # Same directories as the task, so the core outputs land next to the task's files
+        transformer = original_transformer()
+        transformer.base_transformer.base_dir = paths['raw_dir']
+        transformer.base_transformer.processed_dir = paths['processed_dir']
+        transformer.transformed_dir = paths['transformed_dir']
+        return transformer
+
+    original_paths, original_transformer = pipeline.get_base_paths, pipeline.DataTransformer
+    pipeline.get_base_paths = lambda: paths
+    pipeline.DataTransformer = make_transformer
+    try:
+        ti = MockTaskInstance()
+        ti.xcom_push('extraction_timestamp', '20240101_000000')
+        ti.xcom_push('raw_files', [])
+        transform_timestamp = pipeline.transform_data(params={'mode': 'full'}, ti=ti)
+
+        summary_file = os.path.join(paths['transformed_dir'], f"transform_summary_{transform_timestamp}.json")
+        with open(summary_file, 'r') as f:
+            summary = json.load(f)
+        changed_tables = ti.xcom_pull(key='changed_tables')
+        assert len(changed_tables) == 10, changed_tables
+        for name in changed_tables:
+            file_path = os.path.join(paths['transformed_dir'], f"{name}_{transform_timestamp}.parquet")
+            assert os.path.isfile(file_path), file_path
+            rows = len(pd.read_parquet(file_path))
+            assert rows > 0, name
+            logger.info(f"{name}: {rows} rows")
+        assert summary['fact_ecological_measures'] == len(COUNTRIES) * len(YEARS) * len(RECORD_TYPES)
+
+        # The core transformer's partitioned outputs are dataset directories beside the files
+        datasets = [entry for entry in os.listdir(paths['transformed_dir'])
+                    if os.path.isdir(os.path.join(paths['transformed_dir'], entry))]
+        assert any(entry.startswith('agg_by_region_') for entry in datasets), datasets
+        assert not any(entry.endswith('.parquet') for entry in datasets), datasets
+    finally:
+        pipeline.get_base_paths, pipeline.DataTransformer = original_paths, original_transformer
+        shutil.rmtree(root, ignore_errors=True)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    test_transform_data_end_to_end()
+    print("✅ transform_data test passed")
@@ -10,8 +10,16 @@ import json
 import sys
 import os
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+# orjson decodes the JSON responses several times faster; fall back to requests' decoder without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent directory to Python path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -21,13 +29,17 @@ from utils.logging_utils import setup_logger
 # Set up logger for this module
 logger = setup_logger("api_client")
 
+# Keep-alive connections pooled per host; at least as many as the concurrent extract workers
+POOL_MAXSIZE = 32
+
 class FootprintNetworkAPI:
     """
     Client for interacting with the Global Footprint Network API.
     """
     
     def __init__(self, base_url: str = API_BASE_URL, username: str = API_USERNAME,
-                 api_key: str = API_KEY, max_retries: int = 3, retry_delay: int = 2):
+                 api_key: str = API_KEY, max_retries: int = 3, retry_delay: int = 2,
+                 pool_maxsize: int = POOL_MAXSIZE, session: Optional[requests.Session] = None):
         """
         Initialize the API client.
         
@@ -37,13 +49,24 @@ class FootprintNetworkAPI:
             api_key (str): API key for authentication (used as password)
             max_retries (int): Maximum number of retries for failed requests
             retry_delay (int): Delay between retries in seconds
+            pool_maxsize (int): Maximum number of pooled keep-alive connections per host
+            session (requests.Session, optional): Existing session to reuse, e.g. one shared
+                by several clients; its connection pool is left as configured by the caller
         """
         self.base_url = base_url
         self.username = username
         self.api_key = api_key
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.session = requests.Session()
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            
+            # Size the connection pool for concurrent callers; retries stay in _make_request
+            adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
         
         # Set default headers according to API documentation
         self.session.headers.update({
@@ -94,6 +117,12 @@ class FootprintNetworkAPI:
                 # Raise an exception for 4XX/5XX status codes
                 response.raise_for_status()
                 
+                if ORJSON_AVAILABLE:
+                    try:
+                        return orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
+                        # Let requests raise its own decode error, which is retried like before
+                        pass
                 return response.json()
                 
             except (RequestException, Timeout) as e:
@@ -200,6 +229,25 @@ class FootprintNetworkAPI:
             logger.error(f"Failed to retrieve data for country {country_code} for year {year}: {str(e)}")
             raise
     
+    def get_data_for_country_years(self, country_code: str, start_year: int, end_year: int) -> List[Dict[str, Any]]:
+        """
+        Get data for a country over a range of years with a single request.
+        
+        Args:
+            country_code (str): Country code identifier
+            start_year (int): First year to include
+            end_year (int): Last year to include
+            
+        Returns:
+            list: List of data records with start_year <= year <= end_year; records
+                  without a year are left out, as no per-year request returns them
+        """
+        records = self.get_data_for_country_year(country_code, 'all') or []
+        return [
+            row for row in records
+            if row.get('year') is not None and start_year <= int(row['year']) <= end_year
+        ]
+    
     def get_data_for_record_type(self, country_code: str, year: Union[int, str], 
                                record_type: Union[str, List[str]]) -> List[Dict[str, Any]]:
         """
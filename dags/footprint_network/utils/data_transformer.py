@@ -2,17 +2,92 @@
 Module for transforming raw JSON data from the Global Footprint Network API into pandas DataFrames.
 """
 import os
+import re
 import json
-import glob
+import fnmatch
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# ijson lets us stream large measures files record by record; fall back to json.load without it
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# DuckDB parses many JSON files in one multithreaded scan; the Python loop is the fallback
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Raw API keys of ecological measures mapped to our snake_case schema
+MEASURES_KEY_MAP = {
+    'countryCode': 'country_code',
+    'cropLand': 'crop_land',
+    'grazingLand': 'grazing_land',
+    'forestLand': 'forest_land',
+    'fishingGround': 'fishing_ground',
+    'builtupLand': 'builtup_land'
+}
+
+# Numeric ecological measure columns (after renaming to our schema)
+MEASURES_NUMERIC_COLUMNS = (
+    'crop_land', 'grazing_land', 'forest_land', 'fishing_ground', 'builtup_land', 'carbon', 'value'
+)
+
+# Target dtypes for columns shared across tables: Arrow-backed strings and a compact nullable year
+COLUMN_DTYPES = {
+    'country_code': 'string[pyarrow]',
+    'year': 'Int32',
+}
+
+# Compact nullable dtypes for ecological measures: the land columns fit comfortably in float32
+MEASURES_DTYPES = {
+    'year': 'Int32',
+    'crop_land': 'Float32',
+    'grazing_land': 'Float32',
+    'forest_land': 'Float32',
+    'fishing_ground': 'Float32',
+    'builtup_land': 'Float32',
+}
+
+# Parquet writer settings: zstd with dictionary-encoded keys and row groups sized for pushdown
+PARQUET_WRITE_OPTIONS = {
+    'compression': 'zstd',
+    'compression_level': 3,
+    'row_group_size': 131072,
+    'use_dictionary': ['country_code', 'record'],
+    'data_page_size': 1 << 20,
+    'write_batch_size': 8192,
+}
+
+# Size of the in-memory buffer in front of Parquet output files
+PARQUET_BUFFER_SIZE = 1 << 20
+
+# Hive partition columns of the analytics view dataset, coarsest first
+ANALYTICS_PARTITION_COLUMNS = ('year', 'country_code')
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_glob(pattern: str) -> "re.Pattern[str]":
+    """Translate a glob pattern to a compiled regex once and reuse it across scans."""
+    return re.compile(fnmatch.translate(pattern))
+
+
 class FootprintDataTransformer:
     """
     Class for transforming footprint network data from JSON files into pandas DataFrames.
@@ -26,6 +101,10 @@ class FootprintDataTransformer:
         # Create processed directory if it doesn't exist
         os.makedirs(self.processed_dir, exist_ok=True)
         
+        # Results of the last transform_all_data call and the raw files they were built from
+        self._cached_dfs: Optional[Dict[str, pd.DataFrame]] = None
+        self._cached_signature: Optional[Tuple] = None
+        
     def _read_json_file(self, filepath: str) -> List[Dict[str, Any]]:
         """
         Read a JSON file and return its contents.
@@ -44,6 +123,244 @@ class FootprintDataTransformer:
             logger.error(f"Error reading JSON file {filepath}: {str(e)}")
             raise
     
+    def _iter_json_records(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the records of a JSON array file one at a time.
+        
+        Uses ijson when available so only a single record is held in memory,
+        otherwise falls back to loading the whole file.
+        
+        Args:
+            filepath: Path to the JSON file
+            
+        Yields:
+            Each record of the top-level JSON array
+        """
+        if not IJSON_AVAILABLE:
+            yield from self._read_json_file(filepath)
+            return
+        
+        with open(filepath, 'rb') as file:
+            yield from ijson.items(file, 'item', use_float=True)
+    
+    def _records_to_dataframe(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Build a DataFrame from a list of record dicts through Arrow.
+        
+        Arrow infers the struct type over all records (the union of their keys) in C++,
+        which avoids pandas' row-by-row dict inference. Records pyarrow cannot type,
+        such as mixed-type values in one field, fall back to pandas.
+        
+        Args:
+            records: Parsed JSON records
+            
+        Returns:
+            DataFrame with one column per key
+        """
+        try:
+            return pa.RecordBatch.from_struct_array(pa.array(records)).to_pandas()
+        except (pa.ArrowException, TypeError, ValueError):
+            return pd.DataFrame(records)
+    
+    def _write_parquet(self, df: pd.DataFrame, output_path: str, **options: Any) -> None:
+        """
+        Write a DataFrame to Parquet using the module's writer settings.
+        
+        The file is written through a buffered stream so pages are compressed and flushed
+        in large blocks rather than one column chunk at a time.
+        
+        Args:
+            df: DataFrame to write
+            output_path: Destination Parquet file
+            **options: Extra pyarrow writer options overriding PARQUET_WRITE_OPTIONS
+        """
+        options = {**PARQUET_WRITE_OPTIONS, **options}
+        row_group_size = options.pop('row_group_size')
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(output_path, 'wb') as sink, \
+                pa.BufferedOutputStream(sink, buffer_size=PARQUET_BUFFER_SIZE) as buffered, \
+                pq.ParquetWriter(buffered, table.schema, **options) as writer:
+            writer.write_table(table, row_group_size=row_group_size)
+    
+    def _write_parquet_dataset(self, df: pd.DataFrame, base_dir: str, partition_columns: Tuple[str, ...]) -> None:
+        """
+        Write a DataFrame as a hive-partitioned Parquet dataset.
+        
+        Rows are sorted by the partition columns first so each partition is written as a
+        single file, and readers filtering on those columns only open the matching directories.
+        
+        Args:
+            df: DataFrame to write
+            base_dir: Root directory of the dataset
+            partition_columns: Columns used as partition keys, coarsest first
+        """
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Categorical keys arrive dictionary-encoded; partition on their plain values
+        for col in partition_columns:
+            field = table.schema.field(col)
+            if pa.types.is_dictionary(field.type):
+                index = table.schema.get_field_index(col)
+                table = table.set_column(index, col, table.column(col).cast(field.type.value_type))
+        table = table.sort_by([(col, 'ascending') for col in partition_columns])
+        partitioning = ds.partitioning(
+            pa.schema([table.schema.field(col) for col in partition_columns]),
+            flavor='hive'
+        )
+        file_options = ds.ParquetFileFormat().make_write_options(
+            compression=PARQUET_WRITE_OPTIONS['compression'],
+            compression_level=PARQUET_WRITE_OPTIONS['compression_level'],
+            use_dictionary=PARQUET_WRITE_OPTIONS['use_dictionary']
+        )
+        # Allow one partition per (year, country) pair instead of pyarrow's default cap of 1024
+        max_partitions = max(1, len(table.group_by(list(partition_columns)).aggregate([])))
+        ds.write_dataset(
+            table,
+            base_dir=base_dir,
+            format='parquet',
+            partitioning=partitioning,
+            file_options=file_options,
+            max_partitions=max_partitions,
+            max_rows_per_group=PARQUET_WRITE_OPTIONS['row_group_size'],
+            # Rewriting the same timestamp replaces its partitions, as overwriting a single file would
+            existing_data_behavior='delete_matching'
+        )
+    
+    def _coerce_dtypes(self, df: pd.DataFrame, dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """
+        Cast the shared key columns present in a DataFrame in a single astype call.
+        
+        Args:
+            df: DataFrame to cast
+            dtypes: Column dtypes to apply. Defaults to COLUMN_DTYPES.
+            
+        Returns:
+            DataFrame with the dtypes applied to the columns it contains
+        """
+        if dtypes is None:
+            dtypes = COLUMN_DTYPES
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col in df.columns}
+        if not dtypes:
+            return df
+        return df.astype(dtypes)
+    
+    def _align_categorical_key(self, left: pd.DataFrame, right: pd.DataFrame,
+                               column: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Convert a join key to a categorical with identical categories on both sides.
+        
+        Args:
+            left: Left side of the join
+            right: Right side of the join
+            column: Name of the join key column
+            
+        Returns:
+            Tuple with the left and right DataFrames using the shared categorical key
+        """
+        categories = pd.Index(left[column].dropna().unique()).union(pd.Index(right[column].dropna().unique()))
+        dtype = pd.CategoricalDtype(categories)
+        return left.assign(**{column: left[column].astype(dtype)}), right.assign(**{column: right[column].astype(dtype)})
+    
+    def _join_analytics_view_native(self, measures_df: pd.DataFrame, countries_df: pd.DataFrame,
+                                    record_types_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Join measures with countries and record types as one DuckDB query.
+        
+        DuckDB runs both hash joins in a single parallel plan over the registered frames
+        instead of materializing an intermediate merge result.
+        
+        Args:
+            measures_df: Ecological measures DataFrame
+            countries_df: Countries DataFrame
+            record_types_df: Record types DataFrame
+            
+        Returns:
+            Joined DataFrame in the original measures row order, or None if DuckDB is
+            unavailable or the query failed
+        """
+        if not DUCKDB_AVAILABLE:
+            return None
+        
+        try:
+            with duckdb.connect() as conn:
+                # Register Arrow tables so DuckDB scans the column buffers without copying
+                for name, df in (
+                    ('measures', measures_df.assign(_row_order=range(len(measures_df)))),
+                    ('countries', countries_df[['country_code', 'country_name', 'iso_a2']]),
+                    ('record_types', record_types_df[['record', 'name', 'code']]),
+                ):
+                    conn.register(name, pa.Table.from_pandas(df, preserve_index=False))
+                return conn.execute("""
+                    SELECT m.* EXCLUDE (_row_order), c.country_name, c.iso_a2, r.name, r.code
+                    FROM measures m
+                    LEFT JOIN countries c ON m.country_code = c.country_code
+                    LEFT JOIN record_types r ON m.record = r.record
+                    ORDER BY m._row_order
+                """).df()
+        except Exception as e:
+            logger.warning(f"Native analytics join failed, falling back to pandas merges: {str(e)}")
+            return None
+    
+    def _scan_files(self, directory: str, pattern: str) -> List[Tuple[float, str]]:
+        """
+        List files in a directory matching a glob pattern in a single scandir pass.
+        
+        Args:
+            directory: Directory to search in
+            pattern: Glob pattern for file names
+            
+        Returns:
+            List of (modification time, path) tuples, empty if the directory does not exist
+        """
+        matcher = _compiled_glob(pattern)
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries
+                    if entry.is_file() and matcher.match(entry.name)
+                ]
+        except FileNotFoundError:
+            return []
+    
+    def _snapshot_raw(self) -> Dict[str, List[Tuple[float, str]]]:
+        """
+        Scan every raw subdirectory once so a run works from a consistent view of the inputs.
+        
+        Returns:
+            Dictionary mapping each raw subdirectory to its (modification time, path) entries
+        """
+        return {
+            subdir: self._scan_files(os.path.join(self.base_dir, subdir), "*.json")
+            for subdir in ('countries', 'years', 'types', 'data')
+        }
+    
+    def _raw_signature(self, snapshot: Dict[str, List[Tuple[float, str]]]) -> Tuple:
+        """
+        Summarize the raw input files so changes since the last transform can be detected.
+        
+        Args:
+            snapshot: Result of _snapshot_raw
+            
+        Returns:
+            Tuple with the file count and newest modification time of each raw subdirectory
+        """
+        return tuple(
+            (subdir, len(files), max(files)[0] if files else None)
+            for subdir, files in snapshot.items()
+        )
+    
+    def _snapshot_latest(self, snapshot: Dict[str, List[Tuple[float, str]]]) -> Dict[str, Optional[str]]:
+        """
+        Pick the most recent file of each raw subdirectory from a snapshot.
+        
+        Args:
+            snapshot: Result of _snapshot_raw
+            
+        Returns:
+            Dictionary mapping each raw subdirectory to its newest file, or None if it is empty
+        """
+        return {subdir: max(files)[1] if files else None for subdir, files in snapshot.items()}
+    
     def _get_latest_file(self, directory: str, pattern: str = "*.json") -> Optional[str]:
         """
         Get the most recently created JSON file in a directory.
@@ -55,20 +372,20 @@ class FootprintDataTransformer:
         Returns:
             Path to the most recent file, or None if no files found
         """
-        files = glob.glob(os.path.join(directory, pattern))
+        files = self._scan_files(directory, pattern)
         if not files:
             return None
             
-        # Sort by modification time, newest first
-        latest = max(files, key=os.path.getmtime)
-        return latest
+        # Pick the newest file by modification time
+        return max(files)[1]
     
-    def transform_countries(self, filepath: Optional[str] = None) -> pd.DataFrame:
+    def transform_countries(self, filepath: Optional[str] = None, persist: bool = True) -> pd.DataFrame:
         """
         Transform country data from a JSON file into a DataFrame.
         
         Args:
             filepath: Path to the JSON file. If None, the most recent file is used.
+            persist: Whether to save the processed DataFrame as Parquet
             
         Returns:
             DataFrame with country data
@@ -85,7 +402,7 @@ class FootprintDataTransformer:
         countries = self._read_json_file(filepath)
         
         # Create DataFrame
-        df = pd.DataFrame(countries)
+        df = self._records_to_dataframe(countries)
         
         # Rename columns to match our schema
         column_mapping = {
@@ -94,35 +411,38 @@ class FootprintDataTransformer:
             'shortName': 'short_name',
             'isoa2': 'iso_a2'
         }
-        df = df.rename(columns=column_mapping)
+        # Swap the labels on the existing Index instead of allocating a renamed DataFrame
+        df.columns = [column_mapping.get(col, col) for col in df.columns]
         
         # Ensure consistent data types
-        if 'country_code' in df.columns:
-            df['country_code'] = df['country_code'].astype(str)
+        df = self._coerce_dtypes(df)
         
         # Ensure required columns are present
         required_columns = ['country_code', 'country_name']
-        for col in required_columns:
-            if col not in df.columns:
-                logger.error(f"Required column {col} not found in countries data")
-                return pd.DataFrame()
+        missing_columns = set(required_columns) - set(df.columns)
+        if missing_columns:
+            logger.error(f"Required columns {sorted(missing_columns)} not found in countries data")
+            return pd.DataFrame()
         
-        # Add timestamp column
-        df['processed_at'] = datetime.now()
+        # Add timestamp column, reusing the same instant for the output file name
+        now = datetime.now()
+        df['processed_at'] = now
         
         # Save processed data
-        output_path = os.path.join(self.processed_dir, f"countries_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet")
-        df.to_parquet(output_path, index=False)
-        logger.info(f"Saved processed country data to {output_path}")
+        if persist:
+            output_path = os.path.join(self.processed_dir, f"countries_{now.strftime('%Y%m%d_%H%M%S')}.parquet")
+            self._write_parquet(df, output_path)
+            logger.info(f"Saved processed country data to {output_path}")
         
         return df
     
-    def transform_years(self, filepath: Optional[str] = None) -> pd.DataFrame:
+    def transform_years(self, filepath: Optional[str] = None, persist: bool = True) -> pd.DataFrame:
         """
         Transform year data from a JSON file into a DataFrame.
         
         Args:
             filepath: Path to the JSON file. If None, the most recent file is used.
+            persist: Whether to save the processed DataFrame as Parquet
             
         Returns:
             DataFrame with year data
@@ -139,24 +459,27 @@ class FootprintDataTransformer:
         years = self._read_json_file(filepath)
         
         # Create DataFrame
-        df = pd.DataFrame(years)
+        df = self._records_to_dataframe(years)
         
-        # Add timestamp column
-        df['processed_at'] = datetime.now()
+        # Add timestamp column, reusing the same instant for the output file name
+        now = datetime.now()
+        df['processed_at'] = now
         
         # Save processed data
-        output_path = os.path.join(self.processed_dir, f"years_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet")
-        df.to_parquet(output_path, index=False)
-        logger.info(f"Saved processed year data to {output_path}")
+        if persist:
+            output_path = os.path.join(self.processed_dir, f"years_{now.strftime('%Y%m%d_%H%M%S')}.parquet")
+            self._write_parquet(df, output_path)
+            logger.info(f"Saved processed year data to {output_path}")
         
         return df
     
-    def transform_record_types(self, filepath: Optional[str] = None) -> pd.DataFrame:
+    def transform_record_types(self, filepath: Optional[str] = None, persist: bool = True) -> pd.DataFrame:
         """
         Transform record type data from a JSON file into a DataFrame.
         
         Args:
             filepath: Path to the JSON file. If None, the most recent file is used.
+            persist: Whether to save the processed DataFrame as Parquet
             
         Returns:
             DataFrame with record type data
@@ -173,25 +496,126 @@ class FootprintDataTransformer:
         record_types = self._read_json_file(filepath)
         
         # Create DataFrame
-        df = pd.DataFrame(record_types)
+        df = self._records_to_dataframe(record_types)
         
-        # Add timestamp column
-        df['processed_at'] = datetime.now()
+        # Add timestamp column, reusing the same instant for the output file name
+        now = datetime.now()
+        df['processed_at'] = now
         
         # Save processed data
-        output_path = os.path.join(self.processed_dir, f"record_types_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet")
-        df.to_parquet(output_path, index=False)
-        logger.info(f"Saved processed record type data to {output_path}")
+        if persist:
+            output_path = os.path.join(self.processed_dir, f"record_types_{now.strftime('%Y%m%d_%H%M%S')}.parquet")
+            self._write_parquet(df, output_path)
+            logger.info(f"Saved processed record type data to {output_path}")
         
         return df
     
-    def transform_ecological_measures(self, country_code: Optional[str] = None, year: Optional[int] = None) -> pd.DataFrame:
+    def _read_measures_native(self, files: List[str]) -> Optional[pd.DataFrame]:
+        """
+        Read ecological measures files with a single DuckDB read_json scan.
+        
+        All files share the same array-of-records layout, so DuckDB can parse them
+        in parallel native code and hand back one columnar result.
+        
+        Args:
+            files: Paths of the JSON files, in the order their records should appear
+            
+        Returns:
+            DataFrame with snake_case columns, or None if DuckDB is unavailable or the scan failed
+        """
+        if not DUCKDB_AVAILABLE:
+            return None
+        
+        try:
+            with duckdb.connect() as conn:
+                df = conn.execute(
+                    "SELECT * FROM read_json(?, format = 'array', union_by_name = true)",
+                    [files]
+                ).df()
+        except Exception as e:
+            logger.warning(f"Native JSON scan failed, falling back to per-file parsing: {str(e)}")
+            return None
+        
+        # Swap the column labels in place rather than copying the frame through rename
+        df.columns = [MEASURES_KEY_MAP.get(col, col) for col in df.columns]
+        return df
+    
+    def _read_measures_file(self, filepath: str) -> Tuple[Dict[str, List[Any]], int]:
+        """
+        Read a single ecological measures file record by record into snake_case column lists.
+        
+        Args:
+            filepath: Path to the JSON file
+            
+        Returns:
+            Tuple with the column lists and the number of records read
+        """
+        columns: Dict[str, List[Any]] = {}
+        num_rows = 0
+        for raw_record in self._iter_json_records(filepath):
+            # Decode straight into the snake_case schema so no rename is needed afterwards
+            record = {MEASURES_KEY_MAP.get(key, key): value for key, value in raw_record.items()}
+            for key in record:
+                if key not in columns:
+                    columns[key] = [None] * num_rows
+            for key, values in columns.items():
+                values.append(record.get(key))
+            num_rows += 1
+        return columns, num_rows
+    
+    def _read_measures_streaming(self, files: List[str]) -> pd.DataFrame:
+        """
+        Read ecological measures files into snake_case column lists using a thread pool.
+        
+        Each file is parsed independently, so the files are read concurrently and their
+        columns concatenated in the original file order. Files that cannot be parsed are
+        logged and skipped.
+        
+        Args:
+            files: Paths of the JSON files, in the order their records should appear
+            
+        Returns:
+            DataFrame with snake_case columns
+        """
+        columns: Dict[str, List[Any]] = {}
+        num_rows = 0
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(filepath, executor.submit(self._read_measures_file, filepath)) for filepath in files]
+            for filepath, future in futures:
+                try:
+                    file_columns, file_rows = future.result()
+                except Exception as e:
+                    logger.error(f"Error loading measures from {filepath}: {str(e)}")
+                    continue
+                
+                for key in file_columns:
+                    if key not in columns:
+                        columns[key] = [None] * num_rows
+                for key, values in columns.items():
+                    values.extend(file_columns.get(key, [None] * file_rows))
+                num_rows += file_rows
+        
+        # Convert the numeric lists to float arrays in one C-level pass each (None becomes NaN)
+        # instead of letting pandas infer their type value by value
+        for key in MEASURES_NUMERIC_COLUMNS:
+            if key in columns:
+                try:
+                    columns[key] = np.array(columns[key], dtype=np.float64)
+                except (TypeError, ValueError):
+                    logger.warning(f"Column {key} has non-numeric values, keeping inferred dtype")
+        
+        return pd.DataFrame(columns)
+    
+    def transform_ecological_measures(self, country_code: Optional[str] = None, year: Optional[int] = None,
+                                      persist: bool = True) -> pd.DataFrame:
         """
         Transform ecological measures data from JSON files into a DataFrame.
         
         Args:
             country_code: Specific country code to transform data for. If None, all countries are transformed.
             year: Specific year to transform data for. If None, all years are transformed.
+            persist: Whether to save the processed DataFrame as Parquet
             
         Returns:
             DataFrame with ecological measures data
@@ -211,60 +635,45 @@ class FootprintDataTransformer:
         else:
             pattern = "*.json"
         
-        files = glob.glob(os.path.join(data_dir, pattern))
-        if not files:
+        scanned = self._scan_files(data_dir, pattern)
+        if not scanned:
             logger.warning(f"No data files found matching pattern: {pattern}")
             return pd.DataFrame()
         
         # Sort files by modification time, newest first
-        files.sort(key=os.path.getmtime, reverse=True)
+        scanned.sort(reverse=True)
+        files = [path for _, path in scanned]
         
-        all_data = []
         for filepath in files:
             logger.info(f"Transforming ecological measures from {filepath}")
-            try:
-                measures = self._read_json_file(filepath)
-                all_data.extend(measures)
-            except Exception as e:
-                logger.error(f"Error loading measures from {filepath}: {str(e)}")
         
-        if not all_data:
+        # Load all files in a single native scan, falling back to streaming them one by one
+        df = self._read_measures_native(files)
+        if df is None:
+            df = self._read_measures_streaming(files)
+        
+        if df.empty:
             logger.warning("No ecological measures data loaded")
             return pd.DataFrame()
         
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-        
-        # Rename columns to match our schema
-        column_mapping = {
-            'countryCode': 'country_code',
-            'cropLand': 'crop_land',
-            'grazingLand': 'grazing_land',
-            'forestLand': 'forest_land',
-            'fishingGround': 'fishing_ground',
-            'builtupLand': 'builtup_land'
-        }
-        df = df.rename(columns=column_mapping)
-        
-        # Ensure consistent data types
-        if 'country_code' in df.columns:
-            df['country_code'] = df['country_code'].astype(str)
-        if 'year' in df.columns:
-            df['year'] = df['year'].astype(int)
+        # Ensure consistent data types and narrow the numeric measures in the same pass
+        df = self._coerce_dtypes(df, {**COLUMN_DTYPES, **MEASURES_DTYPES})
         
-        # Add timestamp column
-        df['processed_at'] = datetime.now()
+        # Add timestamp column, reusing the same instant for the output file name
+        now = datetime.now()
+        df['processed_at'] = now
         
         # Save processed data
-        filename = f"ecological_measures"
-        if country_code:
-            filename += f"_{country_code}"
-        if year:
-            filename += f"_{year}"
-        
-        output_path = os.path.join(self.processed_dir, f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet")
-        df.to_parquet(output_path, index=False)
-        logger.info(f"Saved processed ecological measures data to {output_path}")
+        if persist:
+            filename = f"ecological_measures"
+            if country_code:
+                filename += f"_{country_code}"
+            if year:
+                filename += f"_{year}"
+            
+            output_path = os.path.join(self.processed_dir, f"{filename}_{now.strftime('%Y%m%d_%H%M%S')}.parquet")
+            self._write_parquet(df, output_path)
+            logger.info(f"Saved processed ecological measures data to {output_path}")
         
         return df
     
@@ -272,21 +681,34 @@ class FootprintDataTransformer:
         """
         Transform all available data into DataFrames.
         
+        Results are reused while the raw input files are unchanged, so a pipeline that
+        transforms the data and then builds the analytics view only parses it once.
+        
         Returns:
             Dictionary with DataFrames by data type
         """
-        # Transform the data
-        countries_df = self.transform_countries()
-        years_df = self.transform_years()
-        record_types_df = self.transform_record_types()
-        measures_df = self.transform_ecological_measures()
-        
-        return {
+        snapshot = self._snapshot_raw()
+        signature = self._raw_signature(snapshot)
+        if self._cached_dfs is not None and signature == self._cached_signature:
+            logger.info("Raw data unchanged since last transform, reusing DataFrames")
+            return dict(self._cached_dfs)
+        
+        # Transform the data; these frames feed the analytics view, so skip writing them
+        latest = self._snapshot_latest(snapshot)
+        countries_df = self.transform_countries(filepath=latest['countries'], persist=False)
+        years_df = self.transform_years(filepath=latest['years'], persist=False)
+        record_types_df = self.transform_record_types(filepath=latest['types'], persist=False)
+        measures_df = self.transform_ecological_measures(persist=False)
+        
+        self._cached_dfs = {
             'countries': countries_df,
             'years': years_df,
             'record_types': record_types_df,
             'ecological_measures': measures_df
         }
+        self._cached_signature = signature
+        
+        return dict(self._cached_dfs)
         
     def create_analytics_view(self, dfs: Optional[Dict[str, pd.DataFrame]] = None) -> pd.DataFrame:
         """
@@ -301,17 +723,19 @@ class FootprintDataTransformer:
         if dfs is None or any(df.empty for df in dfs.values()):
             dfs = self.transform_all_data()
             
-        countries_df = dfs['countries'].copy()
-        record_types_df = dfs['record_types'].copy()
-        measures_df = dfs['ecological_measures'].copy()
+        # No defensive copies: the frames below are only rebound to astype/assign results,
+        # which share untouched column buffers and never mutate the caller's DataFrames
+        countries_df = dfs['countries']
+        record_types_df = dfs['record_types']
+        measures_df = dfs['ecological_measures']
         
         if countries_df.empty or record_types_df.empty or measures_df.empty:
             logger.warning("One or more required DataFrames are empty")
             return pd.DataFrame()
         
         # Ensure consistent data types for join keys
-        countries_df['country_code'] = countries_df['country_code'].astype(str)
-        measures_df['country_code'] = measures_df['country_code'].astype(str)
+        countries_df = self._coerce_dtypes(countries_df)
+        measures_df = self._coerce_dtypes(measures_df)
         
         # Log some information about the data types
         logger.info(f"Countries DataFrame country_code dtype: {countries_df['country_code'].dtype}")
@@ -319,25 +743,33 @@ class FootprintDataTransformer:
         logger.info(f"Sample country codes from countries: {countries_df['country_code'].head(3).tolist()}")
         logger.info(f"Sample country codes from measures: {measures_df['country_code'].head(3).tolist()}")
         
-        # Join countries with measures
-        merged_df = pd.merge(
-            measures_df,
-            countries_df[['country_code', 'country_name', 'iso_a2']],
-            on='country_code',
-            how='left'
-        )
-        
-        # Join record types
-        merged_df = pd.merge(
-            merged_df,
-            record_types_df[['record', 'name', 'code']],
-            on='record',
-            how='left'
-        )
+        # Join countries and record types in a single DuckDB plan, falling back to pandas merges
+        merged_df = self._join_analytics_view_native(measures_df, countries_df, record_types_df)
+        if merged_df is None:
+            # Join on categoricals sharing the same categories so the merges hash integer codes
+            measures_df, countries_df = self._align_categorical_key(measures_df, countries_df, 'country_code')
+            measures_df, record_types_df = self._align_categorical_key(measures_df, record_types_df, 'record')
+            
+            # Join countries with measures
+            merged_df = pd.merge(
+                measures_df,
+                countries_df[['country_code', 'country_name', 'iso_a2']],
+                on='country_code',
+                how='left'
+            )
+            
+            # Join record types
+            merged_df = pd.merge(
+                merged_df,
+                record_types_df[['record', 'name', 'code']],
+                on='record',
+                how='left'
+            )
         
         # Save the analytics view
-        output_path = os.path.join(self.processed_dir, f"analytics_view_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet")
-        merged_df.to_parquet(output_path, index=False)
+        # Partitioned by year and country so readers filtering on either only open matching files
+        output_path = os.path.join(self.processed_dir, f"analytics_view_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self._write_parquet_dataset(merged_df, output_path, ANALYTICS_PARTITION_COLUMNS)
         logger.info(f"Saved analytics view to {output_path}")
         
         return merged_df
@@ -9,16 +9,64 @@ This module implements Phase 1 of the transformation plan:
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
 from typing import Dict, List, Optional, Tuple, Any
 
 from utils.data_transformer import FootprintDataTransformer
 
+# DuckDB runs the indicator joins and aggregations as vectorized SQL; pandas is the fallback
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+# Polars computes the time series changes on its multithreaded engine; pandas is the fallback
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Parquet writer settings for transformed tables: zstd pages with dictionary encoding and statistics
+PARQUET_WRITE_OPTIONS = {
+    'compression': 'zstd',
+    'compression_level': 3,
+    'use_dictionary': True,
+    'data_page_size': 1 << 20,
+    'write_statistics': True,
+    'row_group_size': 256_000,
+}
+
+# Fact and indicator outputs written as hive-partitioned datasets, keyed by their low-cardinality filter columns;
+# every other output (the dimensions included) stays a single Parquet file. Keys are the names passed to _save_dataframe
+PARTITIONED_OUTPUTS = {
+    'fact_ecological_measures': ('record',),
+    'indicator_time_series_changes': ('record',),
+    'agg_by_region': ('region', 'record'),
+    'agg_population_weighted': ('region', 'record'),
+}
+
+# Upper bound on the transformation steps run_all_core_transformations runs at once
+CORE_MAX_WORKERS = 4
+
+# Largest relative rounding error accepted when downcasting measures to float32; rounding alone stays
+# far below it, so only values outside the float32 range (or subnormal in it) keep a column float64
+FLOAT32_TOLERANCE = 1e-3
+
+# Measures never downcast: the indicators sum and difference them, where float32 rounding shows in the results
+FLOAT64_MEASURES = ('value', 'carbon')
+
+# Low-cardinality string columns written as categoricals so Parquet stores them dictionary-encoded
+CATEGORICAL_COLUMNS = ('region', 'income_group', 'record', 'category')
+
 # Mapping of regions by country code - this could be expanded or loaded from a file
 # Just including some examples for demonstration
 REGION_MAPPING = {
@@ -95,6 +143,48 @@ INCOME_MAPPING = {
     '159': 'Low Income',    # Nigeria
 }
 
+# Category assigned to countries missing from a mapping
+UNKNOWN_CATEGORY = 'Unknown'
+
+
+def _compile_mapping(mapping: Dict[str, str]) -> Tuple[pd.Index, pd.Index, np.ndarray]:
+    """
+    Compile a country code mapping into arrays for vectorized categorical lookups.
+    
+    Args:
+        mapping: Mapping of country code to label
+        
+    Returns:
+        Tuple with the mapped country codes, the sorted categories (including
+        UNKNOWN_CATEGORY) and the category code of each mapped country code
+    """
+    categories = pd.Index(sorted(set(mapping.values()) | {UNKNOWN_CATEGORY}))
+    return pd.Index(list(mapping)), categories, categories.get_indexer(list(mapping.values()))
+
+
+# Region and income lookups compiled once at import time
+REGION_LOOKUP = _compile_mapping(REGION_MAPPING)
+INCOME_LOOKUP = _compile_mapping(INCOME_MAPPING)
+
+# Record type categories by record code prefix
+RECORD_CATEGORY_MAPPING = {
+    'BCpc': 'Biocapacity',
+    'BC': 'Biocapacity',
+    'EFCpc': 'Ecological Footprint',
+    'EFC': 'Ecological Footprint',
+    'pop': 'Population',
+    'Land': 'Land Use',
+    'gdp': 'Economic'
+}
+
+# Category assigned to record types without a known prefix
+OTHER_CATEGORY = 'Other'
+
+# Prefix lookup materialized once as a categorical Series, so mapping yields a categorical directly
+RECORD_CATEGORY_SERIES = pd.Series(RECORD_CATEGORY_MAPPING).astype(
+    pd.CategoricalDtype(sorted(set(RECORD_CATEGORY_MAPPING.values()) | {OTHER_CATEGORY}))
+)
+
 class FootprintCoreTransformer:
     """
     Class for implementing core transformations on the Global Footprint Network data.
@@ -115,30 +205,251 @@ class FootprintCoreTransformer:
         # Create transformed directory if it doesn't exist
         os.makedirs(self.transformed_dir, exist_ok=True)
         
-    def _save_dataframe(self, df: pd.DataFrame, name: str) -> str:
+        # In-memory DuckDB database shared by the SQL implementations of the indicators
+        self.conn = duckdb.connect(':memory:') if DUCKDB_AVAILABLE else None
+        
+        # Cleaned tables reused by the indicator methods until invalidate() is called
+        self._countries_cache: Optional[pd.DataFrame] = None
+        self._measures_cache: Optional[pd.DataFrame] = None
+        # Rows of the cached measures split by record, built once alongside the cache
+        self._record_groups: Optional[Dict[str, pd.DataFrame]] = None
+        
+    def invalidate(self) -> None:
+        """
+        Drop the cached cleaned tables so the next call re-reads the upstream data.
+        """
+        self._countries_cache = None
+        self._measures_cache = None
+        self._record_groups = None
+    
+    def close(self) -> None:
+        """
+        Release the in-memory DuckDB connection.
+        
+        Later calls fall back to the pandas implementations.
+        """
+        if DUCKDB_AVAILABLE and self.conn:
+            self.conn.close()
+            self.conn = None
+            logger.info("Closed DuckDB connection")
+    
+    def _query_native(self, sql: str, **frames: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Run a SQL query in DuckDB over DataFrames registered as views.
+        
+        Args:
+            sql: Query to run
+            **frames: DataFrames to register, keyed by the view name used in the query
+            
+        Returns:
+            Query result, or None if DuckDB is unavailable or the query failed
+        """
+        results = self._query_native_batch([sql], **frames)
+        return None if results is None else results[0]
+    
+    def _query_native_batch(self, queries: List[str], setup: Optional[str] = None,
+                            **frames: pd.DataFrame) -> Optional[List[pd.DataFrame]]:
+        """
+        Run several SQL queries in DuckDB over DataFrames registered once as views.
+        
+        Each call uses its own cursor on the shared connection, so registered names
+        and temporary tables created by setup never leak between calls.
+        
+        Args:
+            queries: Queries to run, in order
+            setup: Optional statements run before the queries, e.g. to materialize a
+                temporary table the queries share
+            **frames: DataFrames to register, keyed by the view name used in the queries
+            
+        Returns:
+            One result per query, or None if DuckDB is unavailable or a query failed
+        """
+        if self.conn is None:
+            return None
+        
+        try:
+            with self.conn.cursor() as cursor:
+                # Register Arrow tables so DuckDB scans the column buffers without copying
+                for name, df in frames.items():
+                    cursor.register(name, pa.Table.from_pandas(df, preserve_index=False))
+                if setup:
+                    cursor.execute(setup)
+                return [cursor.execute(sql).df() for sql in queries]
+        except Exception as e:
+            logger.warning(f"DuckDB query failed, falling back to pandas: {str(e)}")
+            return None
+    
+    def _complete_groups(self, agg: pd.DataFrame, key: str, key_dtype: Any,
+                         zero_fill: List[str]) -> pd.DataFrame:
+        """
+        Shape a SQL aggregation like a pandas groupby over key, year and record.
+        
+        Rows with a missing key are dropped and the result is sorted by the keys. For a
+        categorical key this mirrors groupby(..., observed=False): every category, year
+        and record combination is present, with zero counts and sums for empty groups.
+        
+        Args:
+            agg: Aggregation grouped by key, year and record
+            key: Name of the grouping column
+            key_dtype: Dtype of the grouping column in the source data
+            zero_fill: Count and sum columns that are 0 for empty groups
+            
+        Returns:
+            Aggregation with one row per group
+        """
+        keys = [key, 'year', 'record']
+        if not isinstance(key_dtype, pd.CategoricalDtype):
+            return agg.dropna(subset=keys).sort_values(keys).reset_index(drop=True)
+        
+        index = pd.MultiIndex.from_product([
+            pd.CategoricalIndex(key_dtype.categories, dtype=key_dtype),
+            np.sort(agg['year'].dropna().unique()),
+            np.sort(agg['record'].dropna().unique())
+        ], names=keys)
+        
+        dtypes = agg[zero_fill].dtypes.to_dict()
+        agg = agg.dropna(subset=keys).set_index(keys).reindex(index)
+        agg[zero_fill] = agg[zero_fill].fillna(0).astype(dtypes)
+        return agg.reset_index()
+    
+    def _save_dataframe(self, df: pd.DataFrame, name: str, ts: Optional[pd.Timestamp] = None) -> str:
         """
         Save a DataFrame to the transformed directory.
         
+        Outputs listed in PARTITIONED_OUTPUTS are written as a hive-partitioned dataset
+        directory named ``{name}_{timestamp}`` (no ``.parquet`` suffix, so it never
+        collides with a flat file of the same table), and readers filtering on the
+        partition columns skip the other partitions entirely.
+        
         Args:
             df: DataFrame to save
             name: Base name for the file (without timestamp)
+            ts: Timestamp used in the file name. Defaults to the current time.
             
         Returns:
-            Path to the saved file
+            Path to the saved file or dataset directory
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_path = os.path.join(self.transformed_dir, f"{name}_{timestamp}.parquet")
-        df.to_parquet(output_path, index=False)
+        if ts is None:
+            ts = pd.Timestamp.now()
+        timestamp = ts.strftime('%Y%m%d_%H%M%S')
+        categorical = {
+            col: 'category' for col in CATEGORICAL_COLUMNS
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+        }
+        if categorical:
+            df = df.astype(categorical)
+        if name in PARTITIONED_OUTPUTS:
+            output_path = os.path.join(self.transformed_dir, f"{name}_{timestamp}")
+            self.base_transformer._write_parquet_dataset(df, output_path, PARTITIONED_OUTPUTS[name])
+        else:
+            output_path = os.path.join(self.transformed_dir, f"{name}_{timestamp}.parquet")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, output_path, **PARQUET_WRITE_OPTIONS)
         logger.info(f"Saved transformed {name} data to {output_path}")
         return output_path
 
-    def clean_countries(self) -> pd.DataFrame:
+    def _record_rows(self, measures: pd.DataFrame, records: List[str]) -> pd.DataFrame:
+        """
+        Select the measures rows for the given records.
+        
+        When measures is the cached fact table the rows come from the per-record groups built
+        by clean_ecological_measures instead of a boolean scan over the whole table. The result
+        is always a new frame (a single group as a shallow copy), so callers can add or replace
+        columns without touching the cache or tripping pandas' chained-assignment checks.
+        
+        Args:
+            measures: Measures DataFrame to select from
+            records: Record names to keep
+            
+        Returns:
+            DataFrame with the rows of the requested records
+        """
+        if measures is self._measures_cache and self._record_groups is not None:
+            parts = [self._record_groups[record] for record in records if record in self._record_groups]
+            if not parts:
+                return measures.iloc[:0]
+            return parts[0].copy(deep=False) if len(parts) == 1 else pd.concat(parts)
+        return measures[measures['record'].isin(records)].copy(deep=False)
+    
+    def _downcast_measures(self, measures: pd.DataFrame, numeric_cols: List[str]) -> pd.DataFrame:
+        """
+        Downcast the measures fact table to compact dtypes in a single astype call.
+        
+        Metrics other than FLOAT64_MEASURES become float32 unless that would move any
+        value by more than FLOAT32_TOLERANCE relative to its magnitude, year becomes
+        uint16 when it has no missing values and record becomes categorical.
+        
+        Args:
+            measures: Measures DataFrame with missing metrics already filled
+            numeric_cols: Metric columns to downcast
+            
+        Returns:
+            Downcast measures DataFrame
+        """
+        dtypes = {}
+        for col in numeric_cols:
+            if col in FLOAT64_MEASURES:
+                continue
+            values = measures[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            with np.errstate(over='ignore', invalid='ignore'):
+                error = np.abs(values.astype(np.float32) - values)
+            if np.all(error <= FLOAT32_TOLERANCE * np.abs(values), where=~np.isnan(values)):
+                dtypes[col] = 'float32'
+            else:
+                logger.info(f"Keeping {col} as float64: float32 would exceed the rounding tolerance")
+        
+        if 'year' in measures.columns and measures['year'].notna().all() \
+                and measures['year'].between(0, np.iinfo(np.uint16).max).all():
+            dtypes['year'] = 'uint16'
+        if 'record' in measures.columns:
+            dtypes['record'] = 'category'
+        
+        return measures.astype(dtypes)
+    
+    def _lookup_categories(self, country_codes: pd.Categorical,
+                           lookup: Tuple[pd.Index, pd.Index, np.ndarray]) -> pd.Categorical:
+        """
+        Map country codes to a categorical through a compiled lookup.
+        
+        Only the distinct country codes are resolved against the lookup; rows then
+        take their category code by position, so no per-row dictionary access is needed.
+        
+        Args:
+            country_codes: Country codes as a categorical
+            lookup: Compiled mapping from _compile_mapping
+            
+        Returns:
+            Categorical with the mapped labels and UNKNOWN_CATEGORY for unmapped or missing codes
+        """
+        keys, categories, codes = lookup
+        unknown = categories.get_loc(UNKNOWN_CATEGORY)
+        positions = keys.get_indexer(country_codes.categories.astype(str))
+        # One code per distinct country code, plus a trailing Unknown picked by the -1 code of missing values
+        category_codes = np.append(np.where(positions >= 0, codes[positions], unknown), unknown)
+        return pd.Categorical.from_codes(
+            category_codes[country_codes.codes], categories=categories
+        ).remove_unused_categories()
+    
+    def clean_countries(self, ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Clean and transform the countries dimension table.
         
+        The result is cached on the instance until invalidate() is called.
+        
+        Args:
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
+            
         Returns:
             Cleaned countries DataFrame
         """
+        # Reuse the table cleaned earlier, along with its Parquet output
+        if self._countries_cache is not None:
+            return self._countries_cache
+        
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load the countries data
         countries = self.base_transformer.transform_countries()
         if countries.empty:
@@ -150,36 +461,37 @@ class FootprintCoreTransformer:
         # Remove duplicates
         countries = countries.drop_duplicates(subset=['country_code'])
         
-        # Add region mapping
-        countries['region'] = countries['country_code'].map(REGION_MAPPING)
-        
-        # Add income classification
-        countries['income_group'] = countries['country_code'].map(INCOME_MAPPING)
-        
-        # Fill missing values with "Unknown"
-        countries['region'] = countries['region'].fillna("Unknown")
-        countries['income_group'] = countries['income_group'].fillna("Unknown")
+        # Add region mapping and income classification as categoricals, "Unknown" when unmapped
+        country_codes = pd.Categorical(countries['country_code'])
+        countries['region'] = self._lookup_categories(country_codes, REGION_LOOKUP)
+        countries['income_group'] = self._lookup_categories(country_codes, INCOME_LOOKUP)
         
         # Convert to categorical for efficiency
-        countries['region'] = countries['region'].astype('category')
-        countries['income_group'] = countries['income_group'].astype('category')
         countries['score'] = countries['score'].astype('category')
         
         # Add a timestamp for this transformation
-        countries['transformed_at'] = datetime.now()
+        countries['transformed_at'] = ts
         
         # Save the transformed data
-        self._save_dataframe(countries, "dim_countries")
+        self._save_dataframe(countries, "dim_countries", ts)
         
+        self._countries_cache = countries
         return countries
     
-    def clean_years(self) -> pd.DataFrame:
+    def clean_years(self, ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Clean and transform the years dimension table.
         
+        Args:
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
+            
         Returns:
             Cleaned years DataFrame
         """
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load the years data
         years = self.base_transformer.transform_years()
         if years.empty:
@@ -197,25 +509,34 @@ class FootprintCoreTransformer:
         # Add decade column
         years['decade'] = (years['year'] // 10) * 10
         
-        # Create date columns for start and end of year
-        years['start_date'] = pd.to_datetime(years['year'].astype(str) + '-01-01')
-        years['end_date'] = pd.to_datetime(years['year'].astype(str) + '-12-31')
+        # Create date columns for start and end of year straight from the year numbers
+        # (datetime64[Y] counts years from 1970, so no strings are formatted or parsed)
+        year_offsets = years['year'].to_numpy(dtype='int64') - 1970
+        years['start_date'] = year_offsets.astype('datetime64[Y]').astype('datetime64[ns]')
+        years['end_date'] = (year_offsets + 1).astype('datetime64[Y]').astype('datetime64[ns]') - np.timedelta64(1, 'D')
         
         # Add a timestamp for this transformation
-        years['transformed_at'] = datetime.now()
+        years['transformed_at'] = ts
         
         # Save the transformed data
-        self._save_dataframe(years, "dim_years")
+        self._save_dataframe(years, "dim_years", ts)
         
         return years
     
-    def clean_record_types(self) -> pd.DataFrame:
+    def clean_record_types(self, ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Clean and transform the record types dimension table.
         
+        Args:
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
+            
         Returns:
             Cleaned record types DataFrame
         """
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load the record types data
         record_types = self.base_transformer.transform_record_types()
         if record_types.empty:
@@ -227,40 +548,42 @@ class FootprintCoreTransformer:
         # Remove duplicates
         record_types = record_types.drop_duplicates(subset=['record'])
         
-        # Create category groupings
-        # Define a mapping for categories
-        category_mapping = {
-            'BCpc': 'Biocapacity',
-            'BC': 'Biocapacity',
-            'EFCpc': 'Ecological Footprint',
-            'EFC': 'Ecological Footprint',
-            'pop': 'Population',
-            'Land': 'Land Use',
-            'gdp': 'Economic'
-        }
-        
-        # Extract prefix from the code to map to categories
-        record_types['category'] = record_types['code'].str[:4].map(category_mapping)
-        record_types['category'] = record_types['category'].fillna('Other')
-        
-        # Convert to categorical
-        record_types['category'] = record_types['category'].astype('category')
+        # Extract prefix from the code (sliced by Arrow's string kernel) to map to categories
+        prefixes = record_types['code'].astype('string[pyarrow]').str.slice(0, 4)
+        record_types['category'] = (
+            prefixes.map(RECORD_CATEGORY_SERIES)
+            .fillna(OTHER_CATEGORY)
+            .cat.remove_unused_categories()
+        )
         
         # Add a timestamp for this transformation
-        record_types['transformed_at'] = datetime.now()
+        record_types['transformed_at'] = ts
         
         # Save the transformed data
-        self._save_dataframe(record_types, "dim_record_types")
+        self._save_dataframe(record_types, "dim_record_types", ts)
         
         return record_types
     
-    def clean_ecological_measures(self) -> pd.DataFrame:
+    def clean_ecological_measures(self, ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Clean and normalize the ecological measures fact table.
         
+        The result is cached on the instance until invalidate() is called.
+        
+        Args:
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
+            
         Returns:
             Cleaned ecological measures DataFrame
         """
+        # Reuse the table cleaned earlier, along with its Parquet output
+        if self._measures_cache is not None:
+            return self._measures_cache
+        
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load the ecological measures data
         measures = self.base_transformer.transform_ecological_measures()
         if measures.empty:
@@ -283,31 +606,44 @@ class FootprintCoreTransformer:
                 # Fill with 0 or other appropriate value
                 measures[col] = measures[col].fillna(0)
         
+        # Shrink the metrics, year and record to the narrowest dtypes that hold them
+        measures = self._downcast_measures(measures, [col for col in numeric_cols if col in measures.columns])
+        
         # Add a timestamp for this transformation
-        measures['transformed_at'] = datetime.now()
+        measures['transformed_at'] = ts
         
         # Save the transformed data
-        self._save_dataframe(measures, "fact_ecological_measures")
+        self._save_dataframe(measures, "fact_ecological_measures", ts)
         
+        self._measures_cache = measures
+        self._record_groups = {
+            record: group for record, group in measures.groupby('record', observed=True, sort=False)
+        }
         return measures
     
     def calculate_ecological_indicators(self, measures: Optional[pd.DataFrame] = None, 
-                                       countries: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+                                       countries: Optional[pd.DataFrame] = None,
+                                       ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Calculate basic ecological indicators from the measures data.
         
         Args:
             measures: Optional measures DataFrame. If None, it will be loaded.
             countries: Optional countries DataFrame. If None, it will be loaded.
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
             
         Returns:
             DataFrame with ecological indicators
         """
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load data if not provided
         if measures is None:
-            measures = self.clean_ecological_measures()
+            measures = self.clean_ecological_measures(ts)
         if countries is None:
-            countries = self.clean_countries()
+            countries = self.clean_countries(ts)
             
         if measures.empty or countries.empty:
             logger.warning("Missing data for calculating ecological indicators")
@@ -315,68 +651,83 @@ class FootprintCoreTransformer:
         
         logger.info("Calculating ecological indicators")
         
-        # Create a working copy of the measures DataFrame
-        indicators = measures.copy()
-        
         # Filter for biocapacity and footprint records
-        biocapacity = indicators[indicators['record'] == 'BiocapPerCap'].copy()
-        footprint = indicators[indicators['record'] == 'EFConsPerCap'].copy()
+        biocapacity = self._record_rows(measures, ['BiocapPerCap'])
+        footprint = self._record_rows(measures, ['EFConsPerCap'])
         
         # Merge to calculate ecological deficit/reserve
         if not biocapacity.empty and not footprint.empty:
-            # Prepare DataFrames for merging
-            biocapacity = biocapacity.rename(columns={'value': 'biocapacity'})
-            footprint = footprint.rename(columns={'value': 'footprint'})
-            
-            # Select relevant columns for merging
-            biocap_df = biocapacity[['country_code', 'year', 'biocapacity']]
-            footprint_df = footprint[['country_code', 'year', 'footprint']]
-            
-            # Merge the DataFrames
-            eco_balance = pd.merge(
-                biocap_df,
-                footprint_df,
-                on=['country_code', 'year'],
-                how='outer'
-            )
+            # Select the merge columns before renaming, so only those three columns are copied
+            biocap_df = biocapacity[['country_code', 'year', 'value']].rename(columns={'value': 'biocapacity'})
+            footprint_df = footprint[['country_code', 'year', 'value']].rename(columns={'value': 'footprint'})
+            
+            country_info = countries[['country_code', 'country_name', 'region', 'income_group']]
+            
+            # Merge the DataFrames and add country information in a single DuckDB plan
+            eco_balance = self._query_native("""
+                SELECT country_code, year, b.biocapacity, f.footprint,
+                       c.country_name, c.region, c.income_group
+                FROM biocapacity b
+                FULL OUTER JOIN footprint f USING (country_code, year)
+                LEFT JOIN countries c USING (country_code)
+                ORDER BY country_code, year
+            """, biocapacity=biocap_df, footprint=footprint_df, countries=country_info)
+            
+            if eco_balance is not None:
+                # Restore the pandas dtypes of the keys and country categories
+                eco_balance = eco_balance.astype({
+                    'country_code': biocap_df['country_code'].dtype,
+                    'year': biocap_df['year'].dtype,
+                    'region': country_info['region'].dtype,
+                    'income_group': country_info['income_group'].dtype
+                })
+            else:
+                # Measures are unique per (country_code, year) within a record, so the two
+                # series can be aligned on their index instead of hash-merging the frames
+                keys = ['country_code', 'year']
+                eco_balance = pd.concat(
+                    [biocap_df.set_index(keys)['biocapacity'], footprint_df.set_index(keys)['footprint']],
+                    axis=1
+                ).sort_index().reset_index()
+                
+                # Look up country information on the small, uniquely indexed countries table
+                eco_balance = eco_balance.join(country_info.set_index('country_code'), on='country_code')
             
             # Calculate ecological balance
-            eco_balance['ecological_balance'] = eco_balance['biocapacity'] - eco_balance['footprint']
-            eco_balance['ecological_ratio'] = eco_balance['biocapacity'] / eco_balance['footprint']
-            eco_balance['is_deficit'] = eco_balance['ecological_balance'] < 0
-            
-            # Add country information
-            eco_balance = pd.merge(
-                eco_balance,
-                countries[['country_code', 'country_name', 'region', 'income_group']],
-                on='country_code',
-                how='left'
-            )
+            eco_balance.insert(4, 'ecological_balance', eco_balance['biocapacity'] - eco_balance['footprint'])
+            eco_balance.insert(5, 'ecological_ratio', eco_balance['biocapacity'] / eco_balance['footprint'])
+            eco_balance.insert(6, 'is_deficit', eco_balance['ecological_balance'] < 0)
             
             # Add a timestamp for this transformation
-            eco_balance['transformed_at'] = datetime.now()
+            eco_balance['transformed_at'] = ts
             
             # Save the transformed data
-            self._save_dataframe(eco_balance, "indicator_ecological_balance")
+            self._save_dataframe(eco_balance, "indicator_ecological_balance", ts)
             
             return eco_balance
         else:
             logger.warning("Missing biocapacity or footprint data for calculating indicators")
             return pd.DataFrame()
     
-    def calculate_footprint_composition(self, measures: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    def calculate_footprint_composition(self, measures: Optional[pd.DataFrame] = None,
+                                        ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Calculate the composition of ecological footprints.
         
         Args:
             measures: Optional measures DataFrame. If None, it will be loaded.
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
             
         Returns:
             DataFrame with footprint composition
         """
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load data if not provided
         if measures is None:
-            measures = self.clean_ecological_measures()
+            measures = self.clean_ecological_measures(ts)
             
         if measures.empty:
             logger.warning("Missing data for calculating footprint composition")
@@ -384,11 +735,8 @@ class FootprintCoreTransformer:
         
         logger.info("Calculating footprint composition")
         
-        # Create a working copy of the measures DataFrame
-        composition = measures.copy()
-        
-        # Filter for consumption footprint records
-        footprint = composition[composition['record'] == 'EFConsPerCap'].copy()
+        # Filter for consumption footprint records; the columns below are added to this frame only
+        footprint = self._record_rows(measures, ['EFConsPerCap'])
         
         if not footprint.empty:
             # Calculate total for each component
@@ -399,37 +747,44 @@ class FootprintCoreTransformer:
                 if col not in footprint.columns:
                     footprint[col] = 0
             
-            # Calculate the percentage of each component
-            for col in component_cols:
-                footprint[f'{col}_pct'] = footprint[col] / footprint['value'] * 100
+            # Calculate the percentage of each component in one (rows x components) division
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pct = footprint[component_cols].to_numpy() / footprint['value'].to_numpy()[:, None] * 100
+            footprint[[f'{col}_pct' for col in component_cols]] = pct
             
-            # Calculate carbon dependency ratio
-            footprint['carbon_dependency'] = footprint['carbon'] / footprint['value'] * 100
+            # Calculate carbon dependency ratio (the carbon share of the footprint)
+            footprint['carbon_dependency'] = pct[:, component_cols.index('carbon')]
             
             # Add a timestamp for this transformation
-            footprint['transformed_at'] = datetime.now()
+            footprint['transformed_at'] = ts
             
             # Save the transformed data
-            self._save_dataframe(footprint, "indicator_footprint_composition")
+            self._save_dataframe(footprint, "indicator_footprint_composition", ts)
             
             return footprint
         else:
             logger.warning("Missing footprint data for calculating composition")
             return pd.DataFrame()
     
-    def calculate_time_series_changes(self, measures: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    def calculate_time_series_changes(self, measures: Optional[pd.DataFrame] = None,
+                                      ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Calculate time series changes for key metrics.
         
         Args:
             measures: Optional measures DataFrame. If None, it will be loaded.
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
             
         Returns:
             DataFrame with time series changes
         """
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load data if not provided
         if measures is None:
-            measures = self.clean_ecological_measures()
+            measures = self.clean_ecological_measures(ts)
             
         if measures.empty:
             logger.warning("Missing data for calculating time series changes")
@@ -439,79 +794,161 @@ class FootprintCoreTransformer:
         
         # Filter for relevant records
         records_of_interest = ['BiocapPerCap', 'EFConsPerCap', 'Population', 'GDP']
-        time_series = measures[measures['record'].isin(records_of_interest)].copy()
+        time_series = self._record_rows(measures, records_of_interest)
         
         if time_series.empty:
             logger.warning("No relevant records found for time series analysis")
             return pd.DataFrame()
         
-        # Create a pivot table with years as columns
-        pivot_df = time_series.pivot_table(
-            index=['country_code', 'record'], 
-            columns='year', 
-            values='value',
-            aggfunc='first'
-        ).reset_index()
-        
-        # Sort columns for time series operations
-        year_cols = sorted([col for col in pivot_df.columns if isinstance(col, int)])
-        
-        # Calculate year-over-year changes
-        for i in range(1, len(year_cols)):
-            curr_year = year_cols[i]
-            prev_year = year_cols[i-1]
-            pivot_df[f'change_{prev_year}_to_{curr_year}'] = pivot_df[curr_year] - pivot_df[prev_year]
-            pivot_df[f'pct_change_{prev_year}_to_{curr_year}'] = (
-                (pivot_df[curr_year] - pivot_df[prev_year]) / pivot_df[prev_year] * 100
+        # Create a pivot table with years as columns. Cleaned measures hold one row per
+        # (country_code, record, year), so a plain pivot on presorted rows needs no aggregation
+        time_series = time_series.sort_values(['country_code', 'record', 'year'], kind='stable')
+        
+        # Pivot, difference and melt in Polars, falling back to pandas
+        time_series_changes = self._time_series_changes_polars(time_series)
+        if time_series_changes is None:
+            pivot_df = time_series.pivot(
+                index=['country_code', 'record'], 
+                columns='year', 
+                values='value'
             )
-        
-        # Calculate average annual change
-        if len(year_cols) >= 2:
-            first_year = year_cols[0]
-            last_year = year_cols[-1]
-            num_years = last_year - first_year
             
-            if num_years > 0:
-                pivot_df['avg_annual_change'] = (pivot_df[last_year] - pivot_df[first_year]) / num_years
-                pivot_df['avg_annual_pct_change'] = (
-                    ((pivot_df[last_year] / pivot_df[first_year]) ** (1 / num_years) - 1) * 100
-                )
-        
-        # Restore the original structure with additional columns
-        time_series_changes = pivot_df.melt(
-            id_vars=['country_code', 'record'], 
-            var_name='metric',
-            value_name='value'
-        )
+            # Sort columns for time series operations; before reset_index the columns are exactly the years
+            year_cols = pivot_df.columns.sort_values().tolist()
+            pivot_df = pivot_df.reset_index()
+            
+            # Calculate year-over-year changes for all consecutive year pairs in one array pass
+            values = pivot_df[year_cols].to_numpy()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                changes = np.diff(values, axis=1)
+                pct_changes = changes / values[:, :-1] * 100
+            
+            # Interleave absolute and percentage changes per year pair
+            change_names = []
+            for prev_year, curr_year in zip(year_cols[:-1], year_cols[1:]):
+                change_names += [f'change_{prev_year}_to_{curr_year}', f'pct_change_{prev_year}_to_{curr_year}']
+            change_values = np.stack([changes, pct_changes], axis=2).reshape(len(pivot_df), -1)
+            pivot_df = pd.concat(
+                [pivot_df, pd.DataFrame(change_values, columns=change_names, index=pivot_df.index)],
+                axis=1
+            )
+            
+            # Calculate average annual change
+            if len(year_cols) >= 2:
+                first_year = year_cols[0]
+                last_year = year_cols[-1]
+                num_years = last_year - first_year
+                
+                if num_years > 0:
+                    pivot_df['avg_annual_change'] = (pivot_df[last_year] - pivot_df[first_year]) / num_years
+                    # Compound growth rate via log/expm1 instead of a fractional power
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        pivot_df['avg_annual_pct_change'] = (
+                            np.expm1(np.log(pivot_df[last_year] / pivot_df[first_year]) / num_years) * 100
+                        )
+            
+            # Restore the original structure with additional columns
+            time_series_changes = pivot_df.melt(
+                id_vars=['country_code', 'record'], 
+                var_name='metric',
+                value_name='value'
+            )
         
         # Ensure metric column is stored as string
         time_series_changes['metric'] = time_series_changes['metric'].astype(str)
         
         # Add a timestamp for this transformation
-        time_series_changes['transformed_at'] = datetime.now()
+        time_series_changes['transformed_at'] = ts
         
         # Save the transformed data
-        self._save_dataframe(time_series_changes, "indicator_time_series_changes")
+        self._save_dataframe(time_series_changes, "indicator_time_series_changes", ts)
         
         return time_series_changes
     
+    def _time_series_changes_polars(self, time_series: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Compute the time series changes with Polars' multithreaded engine.
+        
+        Produces the same long format as the pandas implementation: one row per
+        country, record and metric, where metrics are the yearly values, the
+        year-over-year changes and the average annual changes.
+        
+        Args:
+            time_series: Measures of the records of interest, sorted by country, record and year
+            
+        Returns:
+            Time series changes, or None if Polars is unavailable or the computation failed
+        """
+        if not POLARS_AVAILABLE:
+            return None
+        
+        try:
+            keys = ['country_code', 'record']
+            frame = pl.from_pandas(time_series[keys + ['year', 'value']]).with_columns(
+                pl.col('country_code').cast(pl.String),
+                pl.col('record').cast(pl.String)
+            )
+            years = sorted(frame['year'].drop_nulls().unique().to_list())
+            year_cols = [str(year) for year in years]
+            
+            # Pivot is eager in Polars; the derived columns and the melt run lazily
+            pivot = frame.pivot(on='year', index=keys, values='value').select(keys + year_cols).sort(keys)
+            
+            exprs = []
+            for prev_year, curr_year in zip(years[:-1], years[1:]):
+                change = pl.col(str(curr_year)) - pl.col(str(prev_year))
+                exprs += [
+                    change.alias(f'change_{prev_year}_to_{curr_year}'),
+                    (change / pl.col(str(prev_year)) * 100).alias(f'pct_change_{prev_year}_to_{curr_year}')
+                ]
+            if len(years) >= 2 and years[-1] > years[0]:
+                first, last, num_years = pl.col(str(years[0])), pl.col(str(years[-1])), years[-1] - years[0]
+                exprs += [
+                    ((last - first) / num_years).alias('avg_annual_change'),
+                    (((last / first).log() / num_years).exp() - 1).mul(100).alias('avg_annual_pct_change')
+                ]
+            
+            result = (
+                pivot.lazy()
+                .with_columns(exprs)
+                .unpivot(index=keys, variable_name='metric', value_name='value')
+                .collect()
+                .to_pandas()
+            )
+        except Exception as e:
+            logger.warning(f"Polars time series computation failed, falling back to pandas: {str(e)}")
+            return None
+        
+        # Restore the pandas dtypes of the keys and values
+        return result.astype({
+            'country_code': time_series['country_code'].dtype,
+            'record': time_series['record'].dtype,
+            'value': time_series['value'].dtype
+        })
+    
     def create_geographical_aggregations(self, measures: Optional[pd.DataFrame] = None, 
-                                        countries: Optional[pd.DataFrame] = None) -> Dict[str, pd.DataFrame]:
+                                        countries: Optional[pd.DataFrame] = None,
+                                        ts: Optional[pd.Timestamp] = None) -> Dict[str, pd.DataFrame]:
         """
         Create geographical aggregations of measures data.
         
         Args:
             measures: Optional measures DataFrame. If None, it will be loaded.
             countries: Optional countries DataFrame. If None, it will be loaded.
+            ts: Transformation timestamp shared by transformed_at and the output file name.
+                Defaults to the current time.
             
         Returns:
             Dictionary with geographical aggregations DataFrames
         """
+        if ts is None:
+            ts = pd.Timestamp.now()
+        
         # Load data if not provided
         if measures is None:
-            measures = self.clean_ecological_measures()
+            measures = self.clean_ecological_measures(ts)
         if countries is None:
-            countries = self.clean_countries()
+            countries = self.clean_countries(ts)
             
         if measures.empty or countries.empty:
             logger.warning("Missing data for geographical aggregations")
@@ -519,81 +956,90 @@ class FootprintCoreTransformer:
         
         logger.info("Creating geographical aggregations")
         
-        # Merge measures with countries to get region and income group
-        geo_data = pd.merge(
-            measures,
-            countries[['country_code', 'region', 'income_group']],
-            on='country_code',
-            how='left'
-        )
-        
         # Filter for most common record types
         common_records = ['BiocapPerCap', 'EFConsPerCap', 'Population', 'GDP']
-        geo_data = geo_data[geo_data['record'].isin(common_records)]
-        
-        # Create region-level aggregations
-        # Only include columns that exist in the data
-        agg_columns = {'value': ['mean', 'median', 'std', 'min', 'max', 'count']}
         
-        # Check if other columns exist before adding to aggregation
-        if 'population' in geo_data.columns:
-            agg_columns['population'] = 'sum'
-        if 'gdp' in geo_data.columns:
-            agg_columns['gdp'] = 'sum'
+        # Aggregate in DuckDB, falling back to pandas merges and groupbys
+        geo_aggs = self._geographical_aggregations_native(measures, countries, common_records)
+        if geo_aggs is not None:
+            region_agg, income_agg, weighted_region_agg = geo_aggs
+        else:
+            # Merge measures with countries to get region and income group
+            geo_data = pd.merge(
+                measures,
+                countries[['country_code', 'region', 'income_group']],
+                on='country_code',
+                how='left'
+            )
             
-        region_agg = geo_data.groupby(['region', 'year', 'record'], observed=False).agg(agg_columns).reset_index()
-        
-        # Fix column names after aggregation
-        region_agg.columns = ['_'.join(col).strip('_') for col in region_agg.columns.values]
-        
-        # Create income group aggregations
-        # Use the same agg_columns dictionary to ensure consistency
-        income_agg = geo_data.groupby(['income_group', 'year', 'record'], observed=False).agg(agg_columns).reset_index()
-        
-        # Fix column names after aggregation
-        income_agg.columns = ['_'.join(col).strip('_') for col in income_agg.columns.values]
-        
-        # Calculate population-weighted metrics for regions only if Population record exists
-        population_records = geo_data[geo_data['record'] == 'Population']
-        
-        # Only proceed with population weighting if we have population data
-        if not population_records.empty:
-            # Create a population lookup from the Population record type
-            pop_lookup = population_records[['country_code', 'year', 'value']].rename(columns={'value': 'population'})
+            geo_data = geo_data[geo_data['record'].isin(common_records)]
             
-            # Merge population data with other metrics
-            weighted_metrics = pd.merge(
-                geo_data[geo_data['record'] != 'Population'],
-                pop_lookup,
-                on=['country_code', 'year'],
-                how='inner'
-            )
+            # Group on plain record labels so only the record types present form groups
+            geo_data = geo_data.astype({'record': object})
             
-            # Calculate weighted values
-            weighted_metrics['weighted_value'] = weighted_metrics['value'] * weighted_metrics['population']
+            # Create region-level aggregations
+            # Only include columns that exist in the data
+            agg_columns = {'value': ['mean', 'median', 'std', 'min', 'max', 'count']}
             
-            # Calculate population-weighted metrics by region
-            weighted_region_agg = weighted_metrics.groupby(['region', 'year', 'record'], observed=False).agg({
-                'weighted_value': 'sum',
-                'population': 'sum'
-            }).reset_index()
+            # Check if other columns exist before adding to aggregation
+            if 'population' in geo_data.columns:
+                agg_columns['population'] = 'sum'
+            if 'gdp' in geo_data.columns:
+                agg_columns['gdp'] = 'sum'
+                
+            region_agg = geo_data.groupby(['region', 'year', 'record'], observed=False).agg(agg_columns).reset_index()
             
-            # Calculate population-weighted average
-            weighted_region_agg['population_weighted_avg'] = weighted_region_agg['weighted_value'] / weighted_region_agg['population']
-        else:
-            weighted_region_agg = pd.DataFrame()
+            # Fix column names after aggregation
+            region_agg.columns = ['_'.join(col).strip('_') for col in region_agg.columns.values]
+            
+            # Create income group aggregations
+            # Use the same agg_columns dictionary to ensure consistency
+            income_agg = geo_data.groupby(['income_group', 'year', 'record'], observed=False).agg(agg_columns).reset_index()
+            
+            # Fix column names after aggregation
+            income_agg.columns = ['_'.join(col).strip('_') for col in income_agg.columns.values]
+            
+            # Calculate population-weighted metrics for regions only if Population record exists
+            population_records = geo_data[geo_data['record'] == 'Population']
+            
+            # Only proceed with population weighting if we have population data
+            if not population_records.empty:
+                # Create a population lookup from the Population record type
+                pop_lookup = population_records[['country_code', 'year', 'value']].rename(columns={'value': 'population'})
+                
+                # Merge population data with other metrics
+                weighted_metrics = pd.merge(
+                    geo_data[geo_data['record'] != 'Population'],
+                    pop_lookup,
+                    on=['country_code', 'year'],
+                    how='inner'
+                )
+                
+                # Calculate weighted values
+                weighted_metrics['weighted_value'] = weighted_metrics['value'] * weighted_metrics['population']
+                
+                # Calculate population-weighted metrics by region
+                weighted_region_agg = weighted_metrics.groupby(['region', 'year', 'record'], observed=False).agg({
+                    'weighted_value': 'sum',
+                    'population': 'sum'
+                }).reset_index()
+                
+                # Calculate population-weighted average
+                weighted_region_agg['population_weighted_avg'] = weighted_region_agg['weighted_value'] / weighted_region_agg['population']
+            else:
+                weighted_region_agg = pd.DataFrame()
         
         # Add timestamps
-        region_agg['transformed_at'] = datetime.now()
-        income_agg['transformed_at'] = datetime.now()
+        region_agg['transformed_at'] = ts
+        income_agg['transformed_at'] = ts
         if not weighted_region_agg.empty:
-            weighted_region_agg['transformed_at'] = datetime.now()
+            weighted_region_agg['transformed_at'] = ts
         
         # Save the transformed data
-        self._save_dataframe(region_agg, "agg_by_region")
-        self._save_dataframe(income_agg, "agg_by_income")
+        self._save_dataframe(region_agg, "agg_by_region", ts)
+        self._save_dataframe(income_agg, "agg_by_income", ts)
         if not weighted_region_agg.empty:
-            self._save_dataframe(weighted_region_agg, "agg_population_weighted")
+            self._save_dataframe(weighted_region_agg, "agg_population_weighted", ts)
         
         return {
             'region_aggregations': region_agg,
@@ -601,30 +1047,147 @@ class FootprintCoreTransformer:
             'weighted_aggregations': weighted_region_agg
         }
     
+    def _geographical_aggregations_native(self, measures: pd.DataFrame, countries: pd.DataFrame,
+                                          records: List[str]) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+        """
+        Compute the region, income group and population-weighted aggregations in DuckDB.
+        
+        The measures are joined with the countries once into a temporary table that
+        both queries read; the region and income group aggregations share one scan
+        through GROUPING SETS. The results match the pandas implementation, including
+        empty groups for categories without data.
+        
+        Args:
+            measures: Cleaned measures DataFrame
+            countries: Cleaned countries DataFrame
+            records: Record types to aggregate
+            
+        Returns:
+            Tuple with the region, income group and population-weighted aggregations,
+            or None if DuckDB is unavailable or a query failed
+        """
+        if self.conn is None:
+            return None
+        
+        # Only include columns that exist in the data
+        sum_columns = [col for col in ('population', 'gdp') if col in measures.columns]
+        frames = {
+            'measures': measures[['country_code', 'year', 'record', 'value'] + sum_columns],
+            'countries': countries[['country_code', 'region', 'income_group']]
+        }
+        record_list = ', '.join(f"'{record}'" for record in records)
+        geo_data = f"""
+            CREATE TEMPORARY TABLE geo_data AS
+            SELECT m.*, c.region, c.income_group
+            FROM measures m
+            LEFT JOIN countries c USING (country_code)
+            WHERE m.record IN ({record_list})
+        """
+        sums = ''.join(f", coalesce(sum({col}), 0) AS {col}_sum" for col in sum_columns)
+        queries = [f"""
+            SELECT GROUPING(region) AS by_income, region, income_group, year, record,
+                   avg(value) AS value_mean, median(value) AS value_median,
+                   stddev_samp(value) AS value_std, min(value) AS value_min,
+                   max(value) AS value_max, count(value) AS value_count{sums}
+            FROM geo_data
+            GROUP BY GROUPING SETS ((region, year, record), (income_group, year, record))
+        """]
+        
+        # Population weighting needs the Population record
+        has_population = bool((measures['record'] == 'Population').any())
+        if has_population:
+            queries.append("""
+                WITH population AS (
+                    SELECT country_code, year, value AS population
+                    FROM geo_data
+                    WHERE record = 'Population'
+                )
+                SELECT g.region, year, g.record,
+                       coalesce(sum(g.value * p.population), 0) AS weighted_value,
+                       coalesce(sum(p.population), 0) AS population
+                FROM geo_data g
+                JOIN population p USING (country_code, year)
+                WHERE g.record <> 'Population'
+                GROUP BY g.region, year, g.record
+            """)
+        
+        results = self._query_native_batch(queries, setup=geo_data, **frames)
+        if results is None:
+            return None
+        aggs = results[0]
+        
+        value_columns = ['value_mean', 'value_median', 'value_std', 'value_min', 'value_max', 'value_count']
+        value_columns += [f"{col}_sum" for col in sum_columns]
+        zero_fill = ['value_count'] + [f"{col}_sum" for col in sum_columns]
+        by_income = aggs['by_income'] == 1
+        region_agg = self._complete_groups(
+            aggs.loc[~by_income, ['region', 'year', 'record'] + value_columns],
+            'region', countries['region'].dtype, zero_fill
+        )
+        income_agg = self._complete_groups(
+            aggs.loc[by_income, ['income_group', 'year', 'record'] + value_columns],
+            'income_group', countries['income_group'].dtype, zero_fill
+        )
+        
+        weighted_region_agg = pd.DataFrame()
+        if has_population:
+            weighted_region_agg = self._complete_groups(
+                results[1], 'region', countries['region'].dtype, ['weighted_value', 'population']
+            )
+            weighted_region_agg['population_weighted_avg'] = weighted_region_agg['weighted_value'] / weighted_region_agg['population']
+        
+        # Restore the year dtype of the measures
+        year_dtype = {'year': measures['year'].dtype}
+        region_agg = region_agg.astype(year_dtype)
+        income_agg = income_agg.astype(year_dtype)
+        if not weighted_region_agg.empty:
+            weighted_region_agg = weighted_region_agg.astype(year_dtype)
+        
+        return region_agg, income_agg, weighted_region_agg
+    
     def run_all_core_transformations(self) -> Dict[str, pd.DataFrame]:
         """
-        Run all core transformations in the correct sequence.
+        Run all core transformations, running independent steps concurrently.
         
         Returns:
             Dictionary with all transformed DataFrames
         """
         logger.info("Running all core transformations")
         
-        # 1. Clean dimension tables
-        countries = self.clean_countries()
-        years = self.clean_years()
-        record_types = self.clean_record_types()
+        # A full run always starts from the current upstream data
+        self.invalidate()
         
-        # 2. Clean fact table
-        measures = self.clean_ecological_measures()
+        # Stamp every output of this run with the same transformation time
+        ts = pd.Timestamp.now()
         
-        # 3. Calculate indicators
-        ecological_balance = self.calculate_ecological_indicators(measures, countries)
-        footprint_composition = self.calculate_footprint_composition(measures)
-        time_series_changes = self.calculate_time_series_changes(measures)
-        
-        # 4. Create geographical aggregations
-        geo_aggs = self.create_geographical_aggregations(measures, countries)
+        # Independent steps run concurrently; pandas, Arrow and DuckDB release the GIL in their kernels
+        with ThreadPoolExecutor(max_workers=min(CORE_MAX_WORKERS, os.cpu_count() or 1)) as executor:
+            # 1. Clean dimension tables
+            countries_future = executor.submit(self.clean_countries, ts)
+            years_future = executor.submit(self.clean_years, ts)
+            record_types_future = executor.submit(self.clean_record_types, ts)
+            
+            # 2. Clean fact table
+            measures_future = executor.submit(self.clean_ecological_measures, ts)
+            
+            # The indicators only depend on the cleaned measures and countries
+            measures = measures_future.result()
+            countries = countries_future.result()
+            
+            # 3. Calculate indicators
+            ecological_balance_future = executor.submit(self.calculate_ecological_indicators, measures, countries, ts)
+            footprint_composition_future = executor.submit(self.calculate_footprint_composition, measures, ts)
+            time_series_changes_future = executor.submit(self.calculate_time_series_changes, measures, ts)
+            
+            # 4. Create geographical aggregations
+            geo_aggs_future = executor.submit(self.create_geographical_aggregations, measures, countries, ts)
+            
+            years = years_future.result()
+            record_types = record_types_future.result()
+            ecological_balance = ecological_balance_future.result()
+            footprint_composition = footprint_composition_future.result()
+            time_series_changes = time_series_changes_future.result()
+            geo_aggs = geo_aggs_future.result()
         
         # Return all results
         results = {
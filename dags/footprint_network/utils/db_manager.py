@@ -2,10 +2,15 @@
 DuckDB integration for the footprint network data.
 """
 import os
+import uuid
 import logging
 import duckdb
+import pandas as pd
+import pyarrow as pa
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+from .duckdb_importer import validate_identifier
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -55,58 +60,134 @@ class FootprintDuckDBManager:
             logger.error(f"Error executing query: {str(e)}")
             raise
     
+    def _insert_frame(self, df: pd.DataFrame, table: str, conflict_clause: str = "") -> int:
+        """
+        Insert all rows of a DataFrame with a single INSERT ... SELECT statement.
+        
+        Args:
+            df (pd.DataFrame): Rows whose columns match columns of the target table
+            table (str): Target table name
+            conflict_clause (str, optional): ON CONFLICT clause appended to the statement
+            
+        Returns:
+            Number of rows inserted or updated
+            
+        Raises:
+            ValueError: If the table or a column name is not a plain identifier
+        """
+        validate_identifier(table)
+        columns = ', '.join(f'"{validate_identifier(col)}"' for col in df.columns)
+        # Register an Arrow table so DuckDB appends whole column chunks instead of boxed rows;
+        # the view name is unique so concurrent inserts on this connection don't replace each other's source
+        source = f"bulk_source_{uuid.uuid4().hex}"
+        self.conn.register(source, pa.Table.from_pandas(df, preserve_index=False))
+        try:
+            self.execute_query(f'INSERT INTO "{table}" ({columns}) SELECT {columns} FROM {source} {conflict_clause}')
+        finally:
+            self.conn.unregister(source)
+        return len(df)
+    
+    def bulk_insert(self, df: pd.DataFrame, table: str) -> int:
+        """
+        Insert a DataFrame into a table in one vectorized statement.
+        
+        Args:
+            df (pd.DataFrame): Rows to insert; columns are matched to the table by name
+            table (str): Target table name
+            
+        Returns:
+            Number of rows inserted
+        """
+        count = self._insert_frame(df, table)
+        logger.info(f"Bulk inserted {count} rows into {table}")
+        return count
+    
+    def bulk_upsert(self, df: pd.DataFrame, table: str, key_columns: List[str]) -> int:
+        """
+        Insert a DataFrame into a table, updating rows whose key already exists.
+        
+        Args:
+            df (pd.DataFrame): Rows to upsert; columns are matched to the table by name.
+                               Keys must be unique within the DataFrame.
+            table (str): Target table name
+            key_columns (list): Primary key columns used to detect conflicts
+            
+        Returns:
+            Number of rows inserted or updated
+        """
+        keys = ', '.join(f'"{validate_identifier(col)}"' for col in key_columns)
+        updates = ', '.join(f'"{col}" = excluded."{col}"' for col in df.columns if col not in key_columns)
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        count = self._insert_frame(df, table, f"ON CONFLICT ({keys}) {action}")
+        logger.info(f"Bulk upserted {count} rows into {table}")
+        return count
+    
     def create_tables(self):
         """
         Create the necessary tables in the database if they don't exist.
-        """
-        # Create countries table
-        self.execute_query("""
-        CREATE TABLE IF NOT EXISTS countries (
-            country_code INTEGER PRIMARY KEY,
-            country_name VARCHAR,
-            short_name VARCHAR,
-            iso_a2 VARCHAR(2)
-        )
-        """)
         
-        # Create years table
-        self.execute_query("""
-        CREATE TABLE IF NOT EXISTS years (
-            year INTEGER PRIMARY KEY
-        )
-        """)
+        All statements are sent as one batch, preceded by the session settings
+        that let the following analytical queries use every core.
+        """
+        statements = [f"PRAGMA threads={os.cpu_count() or 1}"]
         
-        # Create record types table
-        self.execute_query("""
-        CREATE TABLE IF NOT EXISTS record_types (
-            code VARCHAR PRIMARY KEY,
-            name VARCHAR,
-            note TEXT,
-            record VARCHAR
-        )
-        """)
+        # Cap DuckDB's memory only when configured; its default is a share of system memory
+        memory_limit = os.environ.get('DUCKDB_MEMORY_LIMIT')
+        if memory_limit:
+            statements.append(f"PRAGMA memory_limit='{memory_limit}'")
         
-        # Create ecological measures table
-        self.execute_query("""
-        CREATE TABLE IF NOT EXISTS ecological_measures (
-            country_code INTEGER,
-            year INTEGER,
-            record VARCHAR,
-            crop_land DOUBLE,
-            grazing_land DOUBLE,
-            forest_land DOUBLE,
-            fishing_ground DOUBLE,
-            builtup_land DOUBLE,
-            carbon DOUBLE,
-            value DOUBLE,
-            score VARCHAR,
-            loaded_at TIMESTAMP,
-            PRIMARY KEY (country_code, year, record),
-            FOREIGN KEY (country_code) REFERENCES countries(country_code),
-            FOREIGN KEY (year) REFERENCES years(year),
-            FOREIGN KEY (record) REFERENCES record_types(code)
-        )
-        """)
+        # The per-capita land components fit in REAL; carbon and value stay DOUBLE, since value
+        # also carries population and GDP totals and both feed the footprint sums. The key columns
+        # stay INTEGER: the foreign keys are bound even when the tables already exist, so narrowing
+        # them would make this batch fail on every existing database
+        statements += [
+            # Create countries table
+            """
+            CREATE TABLE IF NOT EXISTS countries (
+                country_code INTEGER PRIMARY KEY,
+                country_name VARCHAR,
+                short_name VARCHAR,
+                iso_a2 VARCHAR(2)
+            )
+            """,
+            # Create years table
+            """
+            CREATE TABLE IF NOT EXISTS years (
+                year INTEGER PRIMARY KEY
+            )
+            """,
+            # Create record types table
+            """
+            CREATE TABLE IF NOT EXISTS record_types (
+                code VARCHAR PRIMARY KEY,
+                name VARCHAR,
+                note TEXT,
+                record VARCHAR
+            )
+            """,
+            # Create ecological measures table
+            """
+            CREATE TABLE IF NOT EXISTS ecological_measures (
+                country_code INTEGER,
+                year INTEGER,
+                record VARCHAR,
+                crop_land REAL,
+                grazing_land REAL,
+                forest_land REAL,
+                fishing_ground REAL,
+                builtup_land REAL,
+                carbon DOUBLE,
+                value DOUBLE,
+                score VARCHAR,
+                loaded_at TIMESTAMP,
+                PRIMARY KEY (country_code, year, record),
+                FOREIGN KEY (country_code) REFERENCES countries(country_code),
+                FOREIGN KEY (year) REFERENCES years(year),
+                FOREIGN KEY (record) REFERENCES record_types(code)
+            )
+            """,
+        ]
+        self.execute_query(";\n".join(statements))
         
         logger.info("Database tables created successfully")
     
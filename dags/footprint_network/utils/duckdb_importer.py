@@ -8,11 +8,23 @@ independently to load transformed data into DuckDB.
 """
 
 import os
-import glob
+import re
+import uuid
+import atexit
+import threading
+import fnmatch
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import pyarrow.dataset as ds
+
+__all__ = [
+    'DuckDBParquetImporter', 'DUCKDB_AVAILABLE', 'get_connection', 'close_connections',
+    'is_remote_path', 'validate_identifier', 'main'
+]
+
 # Make the DuckDB import more resilient
 try:
     import duckdb
@@ -30,14 +42,107 @@ except ImportError:
     
     duckdb = DuckDBPlaceholder()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Table, view, index and column names are spliced into SQL text, so only plain identifiers are accepted
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Hive-partitioned datasets are directories named <prefix>_<YYYYmmdd_HHMMSS>, without the .parquet suffix
+DATASET_DIR_PATTERN = re.compile(r".+_\d{8}_\d{6}")
+
+# Splits a scanned file or dataset name into its table prefix and snapshot timestamp
+SNAPSHOT_PATTERN = re.compile(r"(?P<prefix>.+?)_(?P<timestamp>\d{8}_\d{6})(?:\.parquet)?")
+
+# Threads used for parallel imports, and the memory each thread needs before a memory_limit
+# forces the pool smaller (wide tables spill to temp files when threads outgrow the budget)
+IMPORT_THREADS = 8
+MEMORY_PER_THREAD_GB = 2
+
+# Rows per Arrow batch streamed into DuckDB when adding to an existing table
+APPEND_BATCH_SIZE = 100_000
+
+# URL schemes read_parquet serves through the httpfs extension
+REMOTE_SCHEMES = ('http://', 'https://', 's3://', 's3a://', 's3n://', 'gs://', 'gcs://', 'r2://')
+
+# Connections to database files shared by every importer in the process, most recently opened last
+MAX_CACHED_CONNECTIONS = 4
+_CONNECTIONS = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def get_connection(db_path):
+    """
+    Return the process-wide connection to a DuckDB database file, opening it on first use.
+    
+    Consecutive imports into the same database reuse its warmed caches (Parquet footers,
+    statistics) instead of replaying the WAL on a fresh connection. Only the
+    MAX_CACHED_CONNECTIONS most recently opened databases are kept; an evicted connection
+    closes once no importer holds it any more.
+    
+    Args:
+        db_path: Path to the DuckDB database file
+        
+    Returns:
+        DuckDB connection
+    """
+    key = os.path.abspath(db_path)
+    with _CONNECTIONS_LOCK:
+        conn = _CONNECTIONS.get(key)
+        if conn is None:
+            # read_only=False is READ_WRITE access; no other config, so plain connects to the file stay compatible
+            conn = duckdb.connect(db_path, read_only=False)
+            _CONNECTIONS[key] = conn
+            while len(_CONNECTIONS) > MAX_CACHED_CONNECTIONS:
+                _CONNECTIONS.pop(next(iter(_CONNECTIONS)))
+        return conn
+
+
+def close_connections():
+    """Close every cached connection, checkpointing their databases."""
+    with _CONNECTIONS_LOCK:
+        for conn in _CONNECTIONS.values():
+            conn.close()
+        _CONNECTIONS.clear()
+
+
+atexit.register(close_connections)
+
+
+def is_remote_path(path):
+    """
+    Check whether a Parquet path is a URL read through httpfs rather than a local file.
+    
+    Args:
+        path: Parquet file path or URL
+        
+    Returns:
+        True for http(s) and object store URLs
+    """
+    return path.lower().startswith(REMOTE_SCHEMES)
+
+
+def validate_identifier(name):
+    """
+    Check that a name is a plain SQL identifier before it is spliced into a statement.
+    
+    Args:
+        name: Table, view, index or column name
+        
+    Returns:
+        The name, unchanged
+        
+    Raises:
+        ValueError: If the name is not a plain identifier
+    """
+    if not isinstance(name, str) or not IDENTIFIER_PATTERN.fullmatch(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
 class DuckDBParquetImporter:
     """Class for importing Parquet files into DuckDB."""
     
-    def __init__(self, db_path=None, create_if_not_exists=True, multithreading=True):
+    def __init__(self, db_path=None, create_if_not_exists=True, multithreading=True, memory_limit=None):
         """
         Initialize the DuckDB importer.
         
@@ -45,6 +150,8 @@ class DuckDBParquetImporter:
             db_path: Path to the DuckDB database file
             create_if_not_exists: Whether to create the database if it doesn't exist
             multithreading: Whether to use multithreading for import operations
+            memory_limit: Optional DuckDB memory limit in GB; also caps the thread count
+                at one thread per MEMORY_PER_THREAD_GB
         """
         # Check if DuckDB is available
         if not DUCKDB_AVAILABLE:
@@ -54,16 +161,44 @@ class DuckDBParquetImporter:
             
         self.db_path = db_path
         self.multithreading = multithreading
+        self.memory_limit = memory_limit
         
-        # Connect to DuckDB
-        self.conn = duckdb.connect(db_path, read_only=False) if db_path else duckdb.connect()
-        
-        # Configure multithreading
-        if self.multithreading:
-            self.conn.execute("PRAGMA threads=8")  # Use 8 threads for parallel processing
+        # Connect to DuckDB; database files share one connection per process, in-memory databases are private
+        self.conn = get_connection(db_path) if db_path else duckdb.connect()
+        self._configure_connection()
         
         logger.info(f"Initialized DuckDB importer{'with multithreading' if multithreading else ''}")
 
+    def _configure_connection(self):
+        """Apply the bulk-load settings to the current connection."""
+        # Configure multithreading
+        if self.multithreading:
+            threads = IMPORT_THREADS
+            if self.memory_limit:
+                threads = max(1, min(threads, int(self.memory_limit // MEMORY_PER_THREAD_GB)))
+            self.conn.execute(f"PRAGMA threads={threads}")
+        if self.memory_limit:
+            self.conn.execute(f"SET memory_limit='{self.memory_limit}GB'")
+        # Loaded tables have no meaningful row order, so let threads write their chunks as they finish
+        self.conn.execute("SET preserve_insertion_order = false")
+        # Keep Parquet footers cached between the reads of the same file
+        self.conn.execute("PRAGMA enable_object_cache")
+        # httpfs is loaded on the first remote import
+        self._httpfs_loaded = False
+    
+    def _load_httpfs(self):
+        """Load the httpfs extension and the HTTP read settings, once per connection."""
+        if self._httpfs_loaded:
+            return
+        self.conn.execute("INSTALL httpfs; LOAD httpfs;")
+        # Reuse HTTP connections and cache file metadata across the ranged reads of a scan
+        for setting in ("SET http_keep_alive = true", "SET enable_http_metadata_cache = true"):
+            try:
+                self.conn.execute(setting)
+            except Exception as e:
+                logger.warning(f"Could not apply '{setting}': {str(e)}")
+        self._httpfs_loaded = True
+    
     def connect(self):
         """Establish connection to DuckDB database."""
         # Check if DuckDB is available
@@ -73,7 +208,8 @@ class DuckDBParquetImporter:
             
         logger.info(f"Connecting to DuckDB at {self.db_path}")
         try:
-            self.conn = duckdb.connect(self.db_path)
+            self.conn = get_connection(self.db_path) if self.db_path else duckdb.connect()
+            self._configure_connection()
             logger.info("Connected to DuckDB")
             return True
         except Exception as e:
@@ -81,20 +217,106 @@ class DuckDBParquetImporter:
             return False
         
     def close(self):
-        """Close the DuckDB connection."""
+        """
+        Release the DuckDB connection.
+        
+        A shared database-file connection stays open for the next importer and is closed
+        by close_connections at process exit; a private in-memory one is closed now.
+        """
         if DUCKDB_AVAILABLE and self.conn:
-            self.conn.close()
+            if not self.db_path:
+                self.conn.close()
             self.conn = None
             logger.info("Closed DuckDB connection")
     
-    def import_parquet(self, parquet_path, table_name, if_exists="replace"):
+    def _drop_relation(self, name):
+        """
+        Drop the table or view with the given name, whichever exists.
+        
+        Args:
+            name: Name of the table or view
+        """
+        result = self.conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = ?", [name]
+        ).fetchone()
+        if result is not None:
+            kind = "VIEW" if result[0] == "VIEW" else "TABLE"
+            self.conn.execute(f"DROP {kind} {name}")
+    
+    @staticmethod
+    def _path_size(entry):
+        """
+        Size in bytes of a scanned Parquet file or dataset directory.
+        
+        Args:
+            entry: os.DirEntry of the file or directory
+            
+        Returns:
+            File size, or the total size of the files under a directory
+        """
+        if not entry.is_dir():
+            return entry.stat().st_size
+        return sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(entry.path)
+            for name in names
+        )
+    
+    @staticmethod
+    def _scan_name(entry):
+        """
+        Name a scanned entry is matched against the file pattern with.
+        
+        Args:
+            entry: os.DirEntry of the file or directory
+            
+        Returns:
+            The file name; for a dataset directory, its name with the .parquet suffix
+            added, and an empty string for any other directory
+        """
+        if not entry.is_dir():
+            return entry.name
+        return f"{entry.name}.parquet" if DATASET_DIR_PATTERN.fullmatch(entry.name) else ""
+    
+    def _create_parquet_view(self, view_name, files, hive_partitioning):
         """
-        Import a Parquet file into DuckDB.
+        Create (or replace) a view that scans Parquet files at query time.
+        
+        Args:
+            view_name: Name of the view
+            files: Parquet file paths or globs
+            hive_partitioning: Whether the paths carry hive partition keys
+        """
+        # Views cannot hold bound parameters, so the paths are written as quoted literals
+        file_list = ", ".join(
+            "'" + (path if is_remote_path(path) else os.path.abspath(path)).replace("'", "''") + "'"
+            for path in files
+        )
+        self._drop_relation(view_name)
+        self.conn.execute(
+            f"CREATE VIEW {view_name} AS SELECT * FROM "
+            f"read_parquet([{file_list}], hive_partitioning={str(hive_partitioning).lower()})"
+        )
+    
+    def import_parquet(self, parquet_path, table_name, if_exists="replace", materialize=True, columns=None):
+        """
+        Import one or more Parquet files into DuckDB.
+        
+        All paths are read by a single multi-file read_parquet scan, so DuckDB plans the
+        load once and decodes the files in parallel.
         
         Args:
-            parquet_path: Path to the Parquet file
+            parquet_path: Path to a Parquet file or hive-partitioned dataset directory,
+                or a list of such paths loaded into the same table. http(s) and object
+                store URLs are read through httpfs, all in the same parallel scan.
             table_name: Name of the target table
-            if_exists: What to do if the table already exists ('replace' or 'append')
+            if_exists: What to do if the table already exists ('replace' or 'append'). Appends
+                to an existing table stream Arrow batches into an INSERT ... SELECT.
+            materialize: Whether to copy the rows into a DuckDB table. When False in replace
+                mode, a view over the Parquet files is created instead and only the columns
+                a query touches are decoded, at query time. Appends always materialize.
+            columns: Optional list of the columns to materialize when the table is created.
+                All columns stay queryable through a '<table_name>_full' view over the files.
             
         Returns:
             Number of rows imported
@@ -104,110 +326,211 @@ class DuckDBParquetImporter:
             logger.error("Cannot import Parquet: DuckDB is not installed.")
             raise ImportError("DuckDB is not installed. Please install it with 'pip install duckdb'")
             
+        validate_identifier(table_name)
+        for column in columns or []:
+            validate_identifier(column)
+        paths = [parquet_path] if isinstance(parquet_path, str) else list(parquet_path)
+        # Partitioned outputs are directories; their partition keys come back as columns
+        hive_partitioning = any(os.path.isdir(path) for path in paths)
+        remote = any(is_remote_path(path) for path in paths)
+        if remote:
+            self._load_httpfs()
+        files = [
+            os.path.join(path, '**', '*.parquet') if os.path.isdir(path) else path
+            for path in paths
+        ]
+        source = "read_parquet(?, hive_partitioning=?)"
+        params = [files, hive_partitioning]
+        # Only the allowlisted columns are decoded and stored when the table is created
+        projection = ", ".join(f'"{column}"' for column in columns) if columns else "*"
+        
+        if not materialize and if_exists == "replace":
+            self._create_parquet_view(table_name, files, hive_partitioning)
+            # Parquet footers hold the row counts, so this does not decode any data
+            row_count = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+            logger.info(f"Created view '{table_name}' over {row_count} rows from {len(paths)} path(s)")
+            return row_count
+            
         if if_exists == "replace":
-            self.conn.execute(f"DROP TABLE IF EXISTS {table_name}")
-            self.conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM read_parquet('{parquet_path}')")
+            self._drop_relation(table_name)
+            # CREATE TABLE AS returns the number of rows it wrote, so the table is never scanned to count them
+            result = self.conn.execute(f"CREATE TABLE {table_name} AS SELECT {projection} FROM {source}", params)
+            row_count = result.fetchone()[0]
         else:  # append
-            # Check if table exists
-            result = self.conn.execute(f"SELECT name FROM information_schema.tables WHERE table_name = '{table_name}'")
-            if result.fetchone() is None:
-                # Table doesn't exist, create it
-                self.conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM read_parquet('{parquet_path}')")
+            # Create the table from the Parquet schema if it is missing; LIMIT 0 only reads the footers
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} AS SELECT {projection} FROM {source} LIMIT 0", params
+            )
+            # Rows are inserted by name in the table's column order, so extra file columns are ignored
+            table_columns = self.conn.table(table_name).columns
+            if remote:
+                # pyarrow cannot read every remote scheme, so remote files are inserted by DuckDB itself
+                table_projection = ", ".join(f'"{column}"' for column in table_columns)
+                result = self.conn.execute(f"INSERT INTO {table_name} SELECT {table_projection} FROM {source}", params)
+                row_count = result.fetchone()[0]
             else:
-                # Table exists, append to it
-                self.conn.execute(f"INSERT INTO {table_name} SELECT * FROM read_parquet('{parquet_path}')")
+                # Stream Arrow batches straight into DuckDB through a registered reader,
+                # so no batch is converted to pandas on the way
+                table_projection = ", ".join(f'"{column}"' for column in table_columns)
+                row_count = 0
+                for path in paths:
+                    dataset = ds.dataset(path, format='parquet', partitioning='hive' if os.path.isdir(path) else None)
+                    reader = dataset.scanner(columns=table_columns, batch_size=APPEND_BATCH_SIZE).to_reader()
+                    source_name = f"append_source_{uuid.uuid4().hex}"
+                    self.conn.register(source_name, reader)
+                    try:
+                        result = self.conn.execute(
+                            f"INSERT INTO {table_name} SELECT {table_projection} FROM {source_name}"
+                        )
+                        row_count += result.fetchone()[0]
+                    finally:
+                        self.conn.unregister(source_name)
         
-        # Get row count
-        result = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}")
-        row_count = result.fetchone()[0]
+        if columns:
+            # The remaining columns are still reachable, decoded lazily from the files
+            self._create_parquet_view(f"{table_name}_full", files, hive_partitioning)
         
-        logger.info(f"Imported {row_count} rows into table '{table_name}' from {parquet_path}")
+        logger.info(f"Imported {row_count} rows into table '{table_name}' from {len(paths)} path(s)")
         return row_count
     
     def batch_import_directory(self, directory, file_pattern="*.parquet", table_mapping=None, 
-                              timestamp=None, transaction=True):
+                              timestamp=None, transaction=True, table_columns=None):
         """
         Batch import multiple Parquet files from a directory.
         
+        Each table is loaded from a single snapshot: the files of one prefix and timestamp.
+        Without a timestamp, only the latest snapshot of each prefix is loaded. When several
+        prefixes map to the same table, the one named in table_mapping (then the latest)
+        wins and the others are skipped rather than merged into it. A snapshot written both
+        as a flat file and as a dataset directory is loaded from the directory.
+        Hive-partitioned dataset directories (named without the .parquet suffix) are matched
+        as if they carried it.
+        Each table is committed and checkpointed as soon as it is loaded, so a failure only
+        affects its own table and the write-ahead log never holds more than one table.
+        
         Parameters:
         -----------
         directory : str
             Directory containing Parquet files
         file_pattern : str
-            Glob pattern to match files
+            Glob pattern to match file names; patterns of the form '*<suffix>' are
+            matched with a plain suffix check
         table_mapping : dict
-            Optional mapping of file prefixes to table names
+            Optional mapping of file prefixes to table names, or to (table name, materialize)
+            tuples for tables that should be created as views over the Parquet files
         timestamp : str
             Optional specific timestamp to filter files
         transaction : bool
-            Whether to wrap imports in a transaction for atomicity
+            Whether to load each table in its own transaction, so a failed load
+            leaves that table as it was
+        table_columns : dict
+            Optional mapping of table names to the columns to materialize; see import_parquet
         """
         if not self.conn:
             self.connect()
             
         results = {}
         
-        # Get all matching files
-        if timestamp:
-            pattern = os.path.join(directory, f"*_{timestamp}.parquet")
+        # Get all matching files with a single directory scan
+        pattern = f"*_{timestamp}.parquet" if timestamp else file_pattern
+        suffix = pattern[1:]
+        if any(char in suffix for char in '*?['):
+            matches = lambda name: fnmatch.fnmatch(name, pattern)
         else:
-            pattern = os.path.join(directory, file_pattern)
-            
-        files = glob.glob(pattern)
-        logger.info(f"Found {len(files)} files matching pattern in {directory}")
+            matches = lambda name: name.endswith(suffix)
+        with os.scandir(directory) as entries:
+            sized = [(entry.path, self._path_size(entry)) for entry in entries if matches(self._scan_name(entry))]
+        logger.info(f"Found {len(sized)} files matching pattern in {directory}")
         
-        if transaction:
-            self.conn.execute("BEGIN TRANSACTION")
-            
-        try:
-            for file_path in files:
-                file_name = os.path.basename(file_path)
-                # Extract the prefix (everything before the timestamp)
-                prefix = file_name.split('_20')[0]  # Assumes timestamps start with '20'
-                
-                # Determine table name
-                if table_mapping and prefix in table_mapping:
-                    table_name = table_mapping[prefix]
-                else:
-                    # Default: use prefix as table name
-                    table_name = prefix
-                    
-                try:
-                    row_count = self.import_parquet(file_path, table_name)
-                    results[table_name] = {
-                        'file': file_name,
-                        'rows': row_count,
-                        'status': 'success'
-                    }
-                    logger.info(f"Imported {row_count} rows into {table_name} from {file_name}")
-                except Exception as e:
-                    results[table_name] = {
-                        'file': file_name,
-                        'rows': 0,
-                        'status': f'error: {str(e)}'
-                    }
-                    logger.error(f"Failed to import {file_name} into {table_name}: {str(e)}")
-                    if transaction:
-                        # Rollback on any error to maintain atomicity
-                        self.conn.execute("ROLLBACK")
-                        return results
-            
+        # Group the files into snapshots by prefix and timestamp
+        snapshots = {}
+        for file_path, size in sized:
+            file_name = os.path.basename(file_path)
+            match = SNAPSHOT_PATTERN.fullmatch(file_name)
+            if match:
+                key = (match.group('prefix'), match.group('timestamp'))
+            else:
+                key = (os.path.splitext(file_name)[0], '')
+            snapshots.setdefault(key, []).append((file_path, size))
+        
+        # Keep the latest snapshot of each prefix
+        latest = {}
+        for prefix, snapshot_ts in snapshots:
+            if snapshot_ts >= latest.get(prefix, ''):
+                latest[prefix] = snapshot_ts
+        
+        # Pick one prefix per table, preferring an explicit mapping and then the newer snapshot
+        chosen = {}
+        for prefix, snapshot_ts in sorted(latest.items()):
+            mapped = bool(table_mapping) and prefix in table_mapping
+            table_name = table_mapping[prefix] if mapped else prefix
+            table_name, materialize = table_name if isinstance(table_name, tuple) else (table_name, True)
+            rank = (mapped, snapshot_ts)
+            if table_name in chosen:
+                kept = chosen[table_name]
+                if kept['rank'] >= rank:
+                    logger.warning(f"Skipping {prefix}_{snapshot_ts}: {table_name} is loaded from {kept['prefix']}")
+                    continue
+                logger.warning(f"Skipping {kept['prefix']}: {table_name} is loaded from {prefix}_{snapshot_ts}")
+            entries = snapshots[(prefix, snapshot_ts)]
+            # A flat file and a dataset directory of the same snapshot hold the same rows;
+            # scanning both would duplicate them, so the partitioned one is used
+            datasets = [entry for entry in entries if os.path.isdir(entry[0])]
+            entries = datasets[:1] if datasets else entries
+            chosen[table_name] = {
+                'prefix': prefix,
+                'rank': rank,
+                'materialize': materialize,
+                'files': [path for path, _ in entries],
+                'size': sum(size for _, size in entries)
+            }
+        
+        # Largest first, so the longest loads start (and their tables come) first
+        groups = sorted(chosen.items(), key=lambda item: -item[1]['size'])
+        
+        for table_name, group in groups:
+            table_files = group['files']
+            file_names = ', '.join(os.path.basename(path) for path in table_files)
             if transaction:
-                self.conn.execute("COMMIT")
-                logger.info("Transaction committed successfully")
-                
-            return results
+                self.conn.execute("BEGIN TRANSACTION")
+            try:
+                row_count = self.import_parquet(
+                    table_files, table_name,
+                    materialize=group['materialize'],
+                    columns=(table_columns or {}).get(table_name)
+                )
+                if transaction:
+                    self.conn.execute("COMMIT")
+            except Exception as e:
+                if transaction:
+                    # Roll back this table only; the tables loaded before it stay committed
+                    self.conn.execute("ROLLBACK")
+                results[table_name] = {
+                    'file': file_names,
+                    'rows': 0,
+                    'status': f'error: {str(e)}'
+                }
+                logger.error(f"Failed to import {file_names} into {table_name}: {str(e)}")
+                continue
             
-        except Exception as e:
-            if transaction:
-                self.conn.execute("ROLLBACK")
-            logger.error(f"Error during batch import: {str(e)}")
-            raise
+            # Flush the loaded table out of the write-ahead log before starting the next one
+            self.conn.execute("CHECKPOINT")
+            results[table_name] = {
+                'file': file_names,
+                'rows': row_count,
+                'status': 'success'
+            }
+            logger.info(f"Imported {row_count} rows into {table_name} from {file_names}")
+            
+        return results
     
     def create_views(self, views_dict):
         """
         Create analytical views on top of imported tables.
         
+        All views are created or replaced by a single multi-statement script; if that fails,
+        they are retried one by one so the error is logged against the view that caused it.
+        
         Parameters:
         -----------
         views_dict : dict
@@ -216,18 +539,107 @@ class DuckDBParquetImporter:
         if not self.conn:
             self.connect()
             
+        statements = {}
         for view_name, sql in views_dict.items():
+            try:
+                validate_identifier(view_name)
+            except ValueError as e:
+                logger.error(f"Error creating view {view_name}: {str(e)}")
+                continue
+            statements[view_name] = f"CREATE OR REPLACE VIEW {view_name} AS {sql.strip().rstrip(';')}"
+        if not statements:
+            return
+        
+        try:
+            logger.info(f"Creating views: {', '.join(statements)}")
+            self.conn.execute(";\n".join(statements.values()))
+            return
+        except Exception as e:
+            logger.warning(f"Batched view creation failed, creating views one by one: {str(e)}")
+            
+        for view_name, statement in statements.items():
             try:
                 logger.info(f"Creating view: {view_name}")
-                self.conn.execute(f"DROP VIEW IF EXISTS {view_name}")
-                self.conn.execute(f"CREATE VIEW {view_name} AS {sql}")
+                self.conn.execute(statement)
             except Exception as e:
                 logger.error(f"Error creating view {view_name}: {str(e)}")
     
+    @staticmethod
+    def _index_statement(index_name, table, column):
+        """
+        Build the CREATE INDEX statement for an index after validating its identifiers.
+        
+        Parameters:
+        -----------
+        index_name : str
+            Name of the index
+        table : str
+            Table to index
+        column : str
+            Column, or comma-separated columns, to index
+            
+        Returns:
+        --------
+        str
+            CREATE INDEX IF NOT EXISTS statement
+        """
+        validate_identifier(index_name)
+        validate_identifier(table)
+        for name in column.split(','):
+            validate_identifier(name.strip())
+        return f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({column})"
+    
+    def create_indexes_and_views(self, indexes_dict, views_dict):
+        """
+        Create indexes and views in one transaction, then refresh statistics and checkpoint.
+        
+        If the transaction fails it is rolled back and the objects are created
+        individually with create_indexes and create_views, which log the failing ones.
+        
+        Parameters:
+        -----------
+        indexes_dict : dict
+            Dictionary mapping index names to tuples of (table, column)
+        views_dict : dict
+            Dictionary mapping view names to their SQL definitions
+        """
+        if not self.conn:
+            self.connect()
+        
+        try:
+            statements = [
+                self._index_statement(index_name, table, column)
+                for index_name, (table, column) in indexes_dict.items()
+            ]
+            for view_name, sql in views_dict.items():
+                validate_identifier(view_name)
+                statements.append(f"CREATE OR REPLACE VIEW {view_name} AS {sql.strip().rstrip(';')}")
+            
+            logger.info(f"Creating indexes {', '.join(indexes_dict)} and views {', '.join(views_dict)}")
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                for statement in statements:
+                    self.conn.execute(statement)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("ANALYZE")
+        except Exception as e:
+            logger.warning(f"Transactional index and view creation failed, creating them one by one: {str(e)}")
+            self.create_indexes(indexes_dict)
+            self.create_views(views_dict)
+        
+        # Flush the tables, indexes and views to DuckDB's native storage
+        self.conn.execute("CHECKPOINT")
+    
     def create_indexes(self, indexes_dict):
         """
         Create indexes for performance optimization.
         
+        Each table's indexes are built on their own cursor, so indexes on different tables
+        are built concurrently, and a single ANALYZE refreshes the optimizer statistics afterwards.
+        
         Parameters:
         -----------
         indexes_dict : dict
@@ -236,16 +648,35 @@ class DuckDBParquetImporter:
         if not self.conn:
             self.connect()
             
+        # Indexes on the same table would conflict in concurrent transactions, so group them by table
+        by_table = {}
         for index_name, (table, column) in indexes_dict.items():
-            try:
-                logger.info(f"Creating index: {index_name} on {table}({column})")
-                self.conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({column})")
-            except Exception as e:
-                logger.error(f"Error creating index {index_name}: {str(e)}")
+            by_table.setdefault(table, []).append((index_name, column))
+        
+        def build(table, table_indexes):
+            with self.conn.cursor() as cursor:
+                for index_name, column in table_indexes:
+                    try:
+                        logger.info(f"Creating index: {index_name} on {table}({column})")
+                        cursor.execute(self._index_statement(index_name, table, column))
+                    except Exception as e:
+                        logger.error(f"Error creating index {index_name}: {str(e)}")
+        
+        if by_table:
+            with ThreadPoolExecutor(max_workers=len(by_table)) as executor:
+                for future in [executor.submit(build, table, items) for table, items in by_table.items()]:
+                    future.result()
+        
+        try:
+            self.conn.execute("ANALYZE")
+        except Exception as e:
+            logger.error(f"Error analyzing tables: {str(e)}")
 
 
 def main():
     """Command line entry point for importing Parquet files into DuckDB."""
+    # Configure logging here rather than at import, so importing the module (e.g. from a DAG) has no side effects
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     parser = argparse.ArgumentParser(description="Import Parquet files into DuckDB")
     parser.add_argument("--db", required=True, help="DuckDB database path")
     parser.add_argument("--data-dir", required=True, help="Directory containing Parquet files")
@@ -253,20 +684,26 @@ def main():
     parser.add_argument("--no-transaction", action="store_true", help="Disable transaction wrapping")
     args = parser.parse_args()
     
-    # Standard mapping for Global Footprint Network data
+    # Standard mapping for Global Footprint Network data; read-only dimensions and indicators
+    # are views over their Parquet files, except ecological_balance, which gets an index below
     table_mapping = {
-        'dim_countries': 'countries',
-        'dim_years': 'years',
-        'dim_record_types': 'record_types',
+        'dim_countries': ('countries', False),
+        'dim_years': ('years', False),
+        'dim_record_types': ('record_types', False),
         'fact_ecological_measures': 'ecological_measures',
         'indicator_ecological_balance': 'ecological_balance',
-        'indicator_footprint_composition': 'footprint_composition',
-        'indicator_time_series_changes': 'time_series_changes',
+        'indicator_footprint_composition': ('footprint_composition', False),
+        'indicator_time_series_changes': ('time_series_changes', False),
         'agg_by_region': 'region_aggregations',
         'agg_by_income': 'income_aggregations',
         'agg_population_weighted': 'weighted_aggregations'
     }
     
+    # Columns the views below read from the materialized tables; the rest stay in <table>_full
+    table_columns = {
+        'ecological_balance': ['country_code', 'year', 'biocapacity', 'footprint', 'ecological_balance']
+    }
+    
     # Initialize importer
     importer = DuckDBParquetImporter(args.db)
     
@@ -277,7 +714,8 @@ def main():
             args.data_dir, 
             table_mapping=table_mapping,
             timestamp=args.timestamp,
-            transaction=not args.no_transaction
+            transaction=not args.no_transaction,
+            table_columns=table_columns
         )
         
         # Create useful indexes
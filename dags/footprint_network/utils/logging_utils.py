@@ -2,14 +2,43 @@
 Logging utilities for the Global Footprint Network data ingestion pipeline.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
+# Log records buffered before the file handler writes them out; errors are written immediately
+FILE_BUFFER_CAPACITY = 1000
+
+# Loggers already configured by setup_logger, keyed by (name, log level)
+_LOGGERS = {}
+
+def _stop_listener(listener):
+    """
+    Stop a logger's QueueListener and write out everything its handlers buffered.
+    
+    Args:
+        listener (logging.handlers.QueueListener): Listener created by setup_logger
+    """
+    atexit.unregister(listener.stop)
+    listener.stop()
+    for handler in listener.handlers:
+        if isinstance(handler, logging.handlers.MemoryHandler) and handler.target:
+            handler.flush()
+            handler.target.close()
+        handler.close()
+
 def setup_logger(name, log_level=logging.INFO):
     """
     Set up and return a logger with specified name and log level.
     
+    The logger only enqueues records; a background QueueListener (stored as
+    logger.listener) hands them to the console and to a buffered file handler.
+    Repeated calls with the same name and level return the configured logger without
+    touching the filesystem again.
+    
     Args:
         name (str): Name of the logger
         log_level (int): Logging level (default: logging.INFO)
@@ -17,6 +46,10 @@ def setup_logger(name, log_level=logging.INFO):
     Returns:
         logging.Logger: Configured logger object
     """
+    cached = _LOGGERS.get((name, log_level))
+    if cached is not None:
+        return cached
+    
     # Create logs directory if it doesn't exist
     log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
     os.makedirs(log_dir, exist_ok=True)
@@ -26,6 +59,8 @@ def setup_logger(name, log_level=logging.INFO):
     logger.setLevel(log_level)
     
     # Clear existing handlers to avoid duplicate logging
+    if getattr(logger, 'listener', None):
+        _stop_listener(logger.listener)
     if logger.handlers:
         logger.handlers.clear()
     
@@ -43,8 +78,26 @@ def setup_logger(name, log_level=logging.INFO):
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Batch file writes; the buffer is flushed when full, on errors and at shutdown
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        FILE_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
+    
+    # Handle records on a background thread so logging calls only enqueue
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, buffered_file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Drain the queue before logging.shutdown flushes the file buffer
+    atexit.register(listener.stop)
+    logger.listener = listener
+    
+    # Add the queue handler to logger
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
+    # A new level replaces the handlers, so drop the entries cached for the old one
+    for key in [key for key in _LOGGERS if key[0] == name]:
+        del _LOGGERS[key]
+    _LOGGERS[(name, log_level)] = logger
     return logger
@@ -18,27 +18,61 @@ Author: Data Engineering Team
 
 from datetime import datetime, timedelta
 from airflow import DAG
-from airflow.operators.python import PythonOperator
+from airflow.operators.python import PythonOperator, ShortCircuitOperator
 from airflow.operators.bash import BashOperator
 from airflow.operators.dummy import DummyOperator
 from airflow.models import Variable
 from airflow.utils.task_group import TaskGroup
 import os
 import sys
+import functools
+import types
 import logging
 import json
 import time
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Load environment variables from .env file if it exists
+# Environment variable marking that the .env file was loaded; child processes inherit it
+ENV_LOADED_MARKER = '_FOOTPRINT_NETWORK_ENV_LOADED'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_file(env_file_path):
+    """
+    Load environment variables from a .env file once per process.
+    
+    Uses python-dotenv when it is installed and a minimal KEY=VALUE parser otherwise.
+    Values in the file override variables already set, as before.
+    
+    Args:
+        env_file_path: Path to the .env file
+        
+    Returns:
+        True if the file exists and was loaded, False otherwise
+    """
+    if not os.path.exists(env_file_path):
+        return False
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(env_file_path, override=True)
+    except ImportError:
+        with open(env_file_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    os.environ[key] = value
+    return True
+
+
+# Load environment variables from .env file if it exists, skipping re-parses in the same scheduler
 env_file_path = os.path.join(os.path.dirname(__file__), '.env')
-if os.path.exists(env_file_path):
-    with open(env_file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                os.environ[key] = value
+if not os.environ.get(ENV_LOADED_MARKER) and _load_env_file(env_file_path):
+    os.environ[ENV_LOADED_MARKER] = '1'
 
 # Add the footprint_network directory to the path
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'footprint_network'))
@@ -46,8 +80,15 @@ sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'footpr
 # Import our custom modules
 from footprint_network.utils.api_client import FootprintNetworkAPI
 from footprint_network.utils.data_transformer_core import FootprintCoreTransformer as DataTransformer
+from footprint_network.utils.data_transformer_core import CATEGORICAL_COLUMNS, PARQUET_WRITE_OPTIONS
 
 # Make imports resilient to missing packages
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import duckdb
     from footprint_network.utils.duckdb_importer import DuckDBParquetImporter
@@ -78,6 +119,38 @@ START_DATE = datetime(2025, 1, 1)
 TAGS = ['footprint_network', 'ecological_data', 'etl_pipeline']
 CATCHUP = False
 
+# Countries fetched concurrently by extract_data; the API calls are I/O bound
+EXTRACT_MAX_WORKERS = 16
+
+# Transformed tables written concurrently by transform_data; PyArrow releases the GIL while encoding
+TRANSFORM_WRITE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Manifest of the content hashes of the tables loaded into the database, kept beside the database file
+TRANSFORM_MANIFEST = 'manifest.json'
+
+# Run timestamp columns left out of the content hashes, since they change on every run
+HASH_EXCLUDED_COLUMNS = ('transformed_at', 'processed_at')
+
+# Arrow types for the raw API data records; other fields keep their inferred type
+RAW_DATA_TYPES = {
+    'id': pa.int64(),
+    'version': pa.string(),
+    'countryCode': pa.string(),
+    'countryName': pa.string(),
+    'shortName': pa.string(),
+    'isoa2': pa.string(),
+    'year': pa.int64(),
+    'record': pa.string(),
+    'cropLand': pa.float64(),
+    'grazingLand': pa.float64(),
+    'forestLand': pa.float64(),
+    'fishingGround': pa.float64(),
+    'builtupLand': pa.float64(),
+    'carbon': pa.float64(),
+    'value': pa.float64(),
+    'score': pa.string(),
+}
+
 # Define the DAG
 dag = DAG(
     dag_id=DAG_ID,
@@ -101,8 +174,9 @@ dag = DAG(
 
 
 # Helper function to get base directory paths
+@functools.lru_cache(maxsize=1)
 def get_base_paths():
-    """Get base directory paths for data storage"""
+    """Get base directory paths for data storage, creating the directories once per process"""
     base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'footprint_network')
     data_dir = os.path.join(base_dir, 'data')
     raw_dir = os.path.join(data_dir, 'raw')
@@ -114,14 +188,112 @@ def get_base_paths():
     for directory in [data_dir, raw_dir, processed_dir, transformed_dir]:
         os.makedirs(directory, exist_ok=True)
     
-    return {
+    # Read-only view, since every caller shares the cached dictionary
+    return types.MappingProxyType({
         'base_dir': base_dir,
         'data_dir': data_dir,
         'raw_dir': raw_dir,
         'processed_dir': processed_dir,
         'transformed_dir': transformed_dir,
         'db_path': db_path
+    })
+
+
+# Helper function to write JSON files from the pipeline tasks
+def _write_json(path, obj):
+    """
+    Write an object as JSON, using orjson when it is installed.
+    
+    Args:
+        path: Output file path
+        obj: JSON-serializable object
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f)
+
+
+# Helper function to write one transformed table for transform_data
+def _write_transformed(df, file_path):
+    """
+    Write a transformed DataFrame to Parquet with categorical string columns.
+    
+    Args:
+        df: Transformed DataFrame
+        file_path: Output Parquet file path
+    """
+    categorical = {
+        col: 'category' for col in ('country_code',) + CATEGORICAL_COLUMNS
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
     }
+    if categorical:
+        df = df.astype(categorical)
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), file_path, **PARQUET_WRITE_OPTIONS)
+
+
+# Helper function to fingerprint transformed tables for transform_data
+def _content_hash(df):
+    """
+    Compute a content hash of a DataFrame, ignoring the run timestamp columns.
+    
+    Args:
+        df: DataFrame to hash
+        
+    Returns:
+        Hash of the column names and values as a hex string
+    """
+    data = df.drop(columns=[col for col in HASH_EXCLUDED_COLUMNS if col in df.columns])
+    values_hash = pd.util.hash_pandas_object(data, index=False).sum()
+    columns_hash = pd.util.hash_pandas_object(pd.Series(data.columns.astype(str)), index=False).sum()
+    return f"{int(values_hash):016x}{int(columns_hash):016x}"
+
+
+# Helper function to extract one country for extract_data
+def _fetch_country(country_code, start_year, end_year, client, dataset_dir):
+    """
+    Fetch one country's details and yearly data, writing the data to its dataset partition.
+    
+    Each worker writes its own country_code=<code> Parquet file as soon as the
+    response arrives, so only the countries in flight are held in memory.
+    
+    Args:
+        country_code: Country code to fetch
+        start_year: First year to fetch
+        end_year: Last year to fetch (inclusive)
+        client: FootprintNetworkAPI client
+        dataset_dir: Directory of the raw Parquet dataset
+        
+    Returns:
+        Tuple of (country details, number of records written, number of years with data)
+    """
+    logger = logging.getLogger('extract_data')
+    
+    # Get country details
+    country_details = client.get_country_data(country_code)
+    
+    # Fetch all years in one request
+    records = client.get_data_for_country_years(country_code, start_year, end_year)
+    if not records:
+        logger.info(f"No data found for {country_code}")
+        return country_details, 0, 0
+    
+    # Write the country's partition of the raw dataset
+    table = pa.Table.from_pylist(records)
+    table = table.cast(pa.schema([
+        pa.field(field.name, RAW_DATA_TYPES.get(field.name, field.type)) for field in table.schema
+    ]))
+    partition_dir = os.path.join(dataset_dir, f"country_code={country_code}")
+    os.makedirs(partition_dir, exist_ok=True)
+    # Name the file by its year range, so extractions of other ranges into the same dataset keep their files
+    file_name = f"part-{start_year}-{end_year}.parquet"
+    pq.write_table(table, os.path.join(partition_dir, file_name), **PARQUET_WRITE_OPTIONS)
+    years = len(pc.unique(table['year']))
+    
+    logger.info(f"Successfully extracted data for {country_code}: {years} years")
+    return country_details, table.num_rows, years
 
 
 # Task 1: Extract data from Global Footprint Network API
@@ -157,8 +329,8 @@ def extract_data(**kwargs):
     end_year = params.get('end_year')
     countries_param = params.get('countries')
     
-    # Initialize API client
-    client = FootprintNetworkAPI(username=api_username, api_key=api_key)
+    # Initialize API client, reusing a requests session passed by the caller if any
+    client = FootprintNetworkAPI(username=api_username, api_key=api_key, session=kwargs.get('session'))
     
     # Create timestamp for this extraction run
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -169,10 +341,11 @@ def extract_data(**kwargs):
         countries_data = client.get_countries()
         countries = [country.get('countryCode', country.get('code', 'unknown')) for country in countries_data]
     else:
+        # Accept a comma-separated string or an already split sequence of codes
         if isinstance(countries_param, str):
             countries = [c.strip() for c in countries_param.split(',')]
         else:
-            countries = countries_param
+            countries = list(countries_param)
     
     logger.info(f"Will extract data for {len(countries)} countries")
     
@@ -186,67 +359,54 @@ def extract_data(**kwargs):
         'files': []
     }
     
-    # Fetch data for each country and year
+    # Fetch the countries concurrently
     total_records = 0
-    for country_code in countries:
-        country_file = os.path.join(raw_dir, f"country_{country_code}_{timestamp}.json")
-        
-        try:
-            # Get country details
-            country_details = client.get_country_data(country_code)
-            
-            # Fetch data for each year
-            country_data = {
-                'country_code': country_code,
-                'country_details': country_details,
-                'years': {}
-            }
-            
-            for year in range(start_year, end_year + 1):
-                try:
-                    # Fetch all record types for this country and year
-                    year_data = client.get_data_for_country_year(country_code, year)
-                    if year_data:
-                        country_data['years'][str(year)] = year_data
-                        total_records += len(year_data)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch data for {country_code} in {year}: {str(e)}")
-                    continue
-            
-            # Save country data to JSON file
-            with open(country_file, 'w') as f:
-                json.dump(country_data, f)
-            
+    country_details = {}
+    dataset_name = f"ecological_data_{timestamp}"
+    dataset_dir = os.path.join(raw_dir, dataset_name)
+    with ThreadPoolExecutor(max_workers=EXTRACT_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_fetch_country, country_code, start_year, end_year, client, dataset_dir): country_code
+            for country_code in countries
+        }
+        for future in as_completed(futures):
+            country_code = futures[future]
+            try:
+                details, record_count, years = future.result()
+            except Exception as e:
+                logger.error(f"Failed to extract data for {country_code}: {str(e)}")
+                extraction_results['files'].append({
+                    'country': country_code,
+                    'file': None,
+                    'years': 0,
+                    'status': f'error: {str(e)}'
+                })
+                continue
+            country_details[str(country_code)] = details
+            total_records += record_count
             extraction_results['files'].append({
                 'country': country_code,
-                'file': os.path.basename(country_file),
-                'years': len(country_data['years']),
+                'file': f"{dataset_name}/country_code={country_code}" if record_count else None,
+                'years': years,
                 'status': 'success'
             })
-            
-            logger.info(f"Successfully extracted data for {country_code}: {len(country_data['years'])} years")
-            
-        except Exception as e:
-            logger.error(f"Failed to extract data for {country_code}: {str(e)}")
-            extraction_results['files'].append({
-                'country': country_code,
-                'file': None,
-                'years': 0,
-                'status': f'error: {str(e)}'
-            })
+    
+    # Save the country details next to the dataset
+    details_file = os.path.join(raw_dir, f"country_details_{timestamp}.json")
+    _write_json(details_file, country_details)
     
     # Save extraction summary
     summary_file = os.path.join(raw_dir, f"extraction_summary_{timestamp}.json")
     extraction_results['total_records'] = total_records
     extraction_results['timestamp'] = timestamp
     
-    with open(summary_file, 'w') as f:
-        json.dump(extraction_results, f)
+    _write_json(summary_file, extraction_results)
     
     logger.info(f"Extraction completed: {total_records} records from {len(countries)} countries")
     
-    # Push timestamp to XCom for downstream tasks
+    # Push timestamp and the extracted raw files to XCom for downstream tasks
     ti.xcom_push(key='extraction_timestamp', value=timestamp)
+    ti.xcom_push(key='raw_files', value=[entry['file'] for entry in extraction_results['files'] if entry['file']])
     
     return timestamp
 
@@ -279,15 +439,18 @@ def transform_data(**kwargs):
     # Initialize the transformer
     transformer = DataTransformer()
     
-    # Load extraction summary to get files to process
-    summary_file = os.path.join(raw_dir, f"extraction_summary_{extraction_timestamp}.json")
-    
-    try:
-        with open(summary_file, 'r') as f:
-            extraction_summary = json.load(f)
-    except FileNotFoundError:
-        logger.error(f"Extraction summary file not found: {summary_file}")
-        raise
+    # Get the files to process from XCom, reading the extraction summary only if they are missing
+    raw_files = ti.xcom_pull(task_ids='extract_data', key='raw_files')
+    if raw_files is None:
+        summary_file = os.path.join(raw_dir, f"extraction_summary_{extraction_timestamp}.json")
+        try:
+            with open(summary_file, 'r') as f:
+                extraction_summary = json.load(f)
+        except FileNotFoundError:
+            logger.error(f"Extraction summary file not found: {summary_file}")
+            raise
+        raw_files = [entry['file'] for entry in extraction_summary.get('files', []) if entry.get('file')]
+    logger.info(f"Extraction produced {len(raw_files)} raw files")
     
     # Process the raw data
     logger.info("Processing raw data files...")
@@ -296,9 +459,12 @@ def transform_data(**kwargs):
     # Note: In a real deployment, you might want to adapt this code to
     # your specific data loading process
     
-    # Run all transformations
+    # Run all transformations, then release the transformer's DuckDB connection
     logger.info("Running all core transformations...")
-    results = transformer.run_all_core_transformations()
+    try:
+        results = transformer.run_all_core_transformations()
+    finally:
+        transformer.close()
     
     # Extract results from the transformation
     dim_countries = results['dim_countries']
@@ -312,15 +478,35 @@ def transform_data(**kwargs):
     agg_by_income = results['income_aggregations']
     agg_population_weighted = results['weighted_aggregations']
     
-    # Save all transformed data using the _save_dataframe method
-    for name, df in results.items():
-        if isinstance(df, pd.DataFrame):
-            file_path = os.path.join(transformed_dir, f"{name}_{transform_timestamp}.parquet")
-            df.to_parquet(file_path, index=False)
-            logger.info(f"Saved {name} with {len(df)} rows to {file_path}")
-        else:
-            logger.warning(f"Result {name} is not a DataFrame, skipping save")
-
+    # Load the content hashes of the tables already in the database; incremental runs skip unchanged tables
+    incremental = params.get('mode') == 'incremental'
+    manifest_file = os.path.join(os.path.dirname(paths['db_path']), TRANSFORM_MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_file) and os.path.exists(paths['db_path']):
+        with open(manifest_file, 'r') as f:
+            manifest = json.load(f)
+    changed_tables = []
+    table_hashes = {}
+    
+    # Save all transformed data, writing the tables concurrently
+    with ThreadPoolExecutor(max_workers=TRANSFORM_WRITE_WORKERS) as executor:
+        futures = {}
+        for name, df in results.items():
+            if isinstance(df, pd.DataFrame):
+                content_hash = _content_hash(df)
+                if incremental and manifest.get(name) == content_hash:
+                    logger.info(f"Skipping unchanged {name}")
+                    continue
+                table_hashes[name] = content_hash
+                changed_tables.append(name)
+                file_path = os.path.join(transformed_dir, f"{name}_{transform_timestamp}.parquet")
+                futures[executor.submit(_write_transformed, df, file_path)] = (name, len(df), file_path)
+            else:
+                logger.warning(f"Result {name} is not a DataFrame, skipping save")
+        for future in as_completed(futures):
+            name, rows, file_path = futures[future]
+            future.result()
+            logger.info(f"Saved {name} with {rows} rows to {file_path}")
     
     # Create a transformation summary
     transform_summary = {
@@ -340,17 +526,63 @@ def transform_data(**kwargs):
     
     # Save transformation summary
     summary_file = os.path.join(transformed_dir, f"transform_summary_{transform_timestamp}.json")
-    with open(summary_file, 'w') as f:
-        json.dump(transform_summary, f)
+    _write_json(summary_file, transform_summary)
     
     logger.info(f"Transformation completed with timestamp {transform_timestamp}")
     
-    # Push timestamp to XCom for downstream tasks
+    # Push timestamp, the tables written by this run and their hashes to XCom for downstream tasks;
+    # load_data records the hashes in the manifest once the tables are committed
     ti.xcom_push(key='transform_timestamp', value=transform_timestamp)
+    ti.xcom_push(key='changed_tables', value=changed_tables)
+    ti.xcom_push(key='table_hashes', value=table_hashes)
     
     return transform_timestamp
 
 
+# Helper function to bulk-load transformed files for load_data
+def _load_tables(conn, transformed_dir, table_mapping, transform_timestamp):
+    """
+    Create one table per transformed Parquet file with CREATE OR REPLACE TABLE ... AS SELECT.
+    
+    All tables are created in a single transaction, so a failure leaves the
+    previously loaded tables in place.
+    
+    Args:
+        conn: DuckDB connection
+        transformed_dir: Directory containing the transformed Parquet files
+        table_mapping: Dictionary mapping file prefixes to table names
+        transform_timestamp: Timestamp of the transformed files to load
+        
+    Returns:
+        Dictionary with load results per table
+    """
+    logger = logging.getLogger('load_data')
+    results = {}
+    
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        for prefix, table_name in table_mapping.items():
+            file_path = os.path.join(transformed_dir, f"{prefix}_{transform_timestamp}.parquet")
+            if not os.path.exists(file_path):
+                logger.warning(f"Transformed file not found for {table_name}: {file_path}")
+                results[table_name] = {'status': 'missing', 'file': file_path, 'rows': 0}
+                continue
+            
+            conn.execute(
+                f'CREATE OR REPLACE TABLE "{table_name}" AS SELECT * FROM read_parquet(?)',
+                [os.path.abspath(file_path)]
+            )
+            row_count = conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+            results[table_name] = {'status': 'success', 'file': file_path, 'rows': row_count}
+            logger.info(f"Loaded {row_count} rows into {table_name}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    
+    return results
+
+
 # Task 3: Load transformed data into DuckDB
 def load_data(**kwargs):
     """Load transformed Parquet data into DuckDB"""
@@ -363,8 +595,10 @@ def load_data(**kwargs):
                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     logger = logging.getLogger('load_data')
     
-    # Get timestamp from previous task
+    # Get timestamp and the rewritten tables from previous task
     transform_timestamp = ti.xcom_pull(task_ids='transform_data', key='transform_timestamp')
+    changed_tables = ti.xcom_pull(task_ids='transform_data', key='changed_tables')
+    table_hashes = ti.xcom_pull(task_ids='transform_data', key='table_hashes') or {}
     logger.info(f"Starting loading of data transformed at {transform_timestamp}")
     
     # Get paths
@@ -381,11 +615,16 @@ def load_data(**kwargs):
         'indicator_ecological_balance': 'ecological_balance',
         'indicator_footprint_composition': 'footprint_composition',
         'indicator_time_series_changes': 'time_series_changes',
-        'agg_by_region': 'region_aggregations',
-        'agg_by_income': 'income_aggregations',
-        'agg_population_weighted': 'weighted_aggregations'
+        'region_aggregations': 'region_aggregations',
+        'income_aggregations': 'income_aggregations',
+        'weighted_aggregations': 'weighted_aggregations'
     }
     
+    # Tables unchanged since the previous run keep their loaded contents
+    if changed_tables is not None:
+        table_mapping = {prefix: table for prefix, table in table_mapping.items() if prefix in changed_tables}
+        logger.info(f"Loading {len(table_mapping)} changed tables")
+    
     # Check if DuckDB is available
     if not DUCKDB_AVAILABLE:
         logger.warning("DuckDB is not installed. Skipping data loading phase.")
@@ -401,8 +640,7 @@ def load_data(**kwargs):
         
         # Save load summary
         summary_file = os.path.join(transformed_dir, f"load_summary_{transform_timestamp}.json")
-        with open(summary_file, 'w') as f:
-            json.dump(load_summary, f)
+        _write_json(summary_file, load_summary)
         
         logger.info(f"Data loading skipped. Summary saved to {summary_file}")
         return load_summary
@@ -413,13 +651,8 @@ def load_data(**kwargs):
     try:
         logger.info(f"Starting import of transformed data into DuckDB at {db_path}")
         
-        # Import all transformed data files with the specific timestamp
-        results = importer.batch_import_directory(
-            transformed_dir, 
-            table_mapping=table_mapping,
-            timestamp=transform_timestamp,
-            transaction=True  # Use transaction for atomic operation
-        )
+        # Bulk-load all transformed data files with the specific timestamp
+        results = _load_tables(importer.conn, transformed_dir, table_mapping, transform_timestamp)
         
         # Create useful indexes for query performance
         indexes = {
@@ -427,7 +660,6 @@ def load_data(**kwargs):
             "idx_ecological_measures_record": ("ecological_measures", "record"),
             "idx_ecological_measures_country_year": ("ecological_measures", "country_code, year")
         }
-        importer.create_indexes(indexes)
         
         # Create analytical views
         views = {
@@ -459,7 +691,21 @@ def load_data(**kwargs):
                 ORDER BY ia.income_group, ia.record, ia.year
             """
         }
-        importer.create_views(views)
+        
+        # Create the indexes and views in one transaction, then analyze and checkpoint
+        importer.create_indexes_and_views(indexes, views)
+        
+        # Record the hashes of the committed tables, so the next incremental run skips them
+        manifest_file = os.path.join(os.path.dirname(db_path), TRANSFORM_MANIFEST)
+        manifest = {}
+        if os.path.exists(manifest_file):
+            with open(manifest_file, 'r') as f:
+                manifest = json.load(f)
+        manifest.update({
+            prefix: table_hashes[prefix] for prefix, table_name in table_mapping.items()
+            if prefix in table_hashes and results[table_name]['status'] == 'success'
+        })
+        _write_json(manifest_file, manifest)
         
         # Calculate load statistics
         success_count = sum(1 for r in results.values() if r['status'] == 'success')
@@ -477,8 +723,7 @@ def load_data(**kwargs):
         
         # Save load summary
         summary_file = os.path.join(transformed_dir, f"load_summary_{transform_timestamp}.json")
-        with open(summary_file, 'w') as f:
-            json.dump(load_summary, f)
+        _write_json(summary_file, load_summary)
         
         logger.info(f"Loading completed: {success_count}/{len(results)} tables with {total_rows} rows")
         
@@ -505,13 +750,10 @@ with TaskGroup(group_id="prepare_environment", dag=dag) as prepare_environment:
         dag=dag
     )
     
-    # Task: Check API credentials
-    check_api_credentials = PythonOperator(
+    # Task: Check API credentials, skipping the downstream tasks when they are missing
+    check_api_credentials = ShortCircuitOperator(
         task_id='check_api_credentials',
-        python_callable=lambda **kwargs: all(
-            x is not None and x != '' for x in 
-            [kwargs['params'].get('api_username'), kwargs['params'].get('api_key')]
-        ),
+        python_callable=lambda **kwargs: bool(kwargs['params'].get('api_username')) and bool(kwargs['params'].get('api_key')),
         dag=dag
     )
     